@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from typing import Any
 
 from .rate_limiter import RateLimiter
@@ -17,10 +18,12 @@ class BaseAPIClient:
     @staticmethod
     def _to_dict(resp: Any) -> Any:
         """Convert SDK response to dict (supports to_dict, model_dump, or passthrough)."""
-        if hasattr(resp, "to_dict"):
-            return resp.to_dict()
-        if hasattr(resp, "model_dump"):
-            return resp.model_dump()
+        to_dict = getattr(resp, "to_dict", None)
+        if to_dict is not None:
+            return to_dict()
+        model_dump = getattr(resp, "model_dump", None)
+        if model_dump is not None:
+            return model_dump()
         return resp
 
     async def _rate_read(self, cost: float = 1.0) -> None:
@@ -38,3 +41,35 @@ class BaseAPIClient:
         """Rate-limit, await, and convert an SDK write call."""
         await self._rate_write(cost)
         return self._to_dict(await coro)
+
+
+async def iter_pages(
+    fetch: Callable[..., Awaitable[dict[str, Any]]],
+    *,
+    max_pages: int | None = None,
+    **kwargs: Any,
+) -> AsyncGenerator[dict[str, Any]]:
+    """Yield cursor-paginated responses, fetching page N+1 while page N is consumed.
+
+    ``fetch`` is called as ``fetch(cursor=..., **kwargs)``.  Iteration stops when a
+    response has no ``cursor`` or after ``max_pages`` pages.  Closing the iterator
+    early (``contextlib.aclosing``) cancels the in-flight prefetch, or retrieves its
+    error if it already failed so it is not reported as never retrieved.
+    """
+    pending: asyncio.Future[dict[str, Any]] | None = asyncio.ensure_future(
+        fetch(cursor=None, **kwargs)
+    )
+    pages = 0
+    try:
+        while pending is not None:
+            resp = await pending
+            pages += 1
+            cursor = resp.get("cursor")
+            pending = None
+            if cursor and not (max_pages and pages >= max_pages):
+                pending = asyncio.ensure_future(fetch(cursor=cursor, **kwargs))
+                await asyncio.sleep(0)  # let the prefetch start before the caller works
+            yield resp
+    finally:
+        if pending is not None and not pending.cancel() and not pending.cancelled():
+            pending.exception()  # already finished; mark any error as retrieved
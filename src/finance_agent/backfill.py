@@ -8,7 +8,6 @@ it in DuckDB.  Standalone long-running command via ``make backfill`` or
 from __future__ import annotations
 
 import http.client
-import json
 import logging
 import ssl
 import threading
@@ -17,6 +16,8 @@ from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, date, datetime, timedelta
 from typing import Any
 
+import orjson
+
 from .database import AgentDatabase
 
 logger = logging.getLogger(__name__)
@@ -59,7 +60,7 @@ def _fetch_daily(d: date) -> list[dict[str, Any]] | None:
             if not chunk:
                 break
             chunks.append(chunk)
-        return json.loads(b"".join(chunks))
+        return orjson.loads(b"".join(chunks))
     except Exception:
         if _shutdown_event.is_set():
             return None
@@ -77,9 +78,9 @@ def _fetch_and_normalise(d: date) -> tuple[date, list[dict[str, Any]], float]:
     if _shutdown_event.is_set():
         return d, [], 0.0
     logger.info("  Fetching %s ...", d)
-    t0 = time.time()
+    t0 = time.monotonic()
     records = _fetch_daily(d)
-    fetch_elapsed = time.time() - t0
+    fetch_elapsed = time.monotonic() - t0
     if not records:
         return d, [], fetch_elapsed
     rows = [_normalise_row(r) for r in records if _has_activity(r)]
@@ -169,9 +170,9 @@ def sync_daily(db: AgentDatabase, max_workers: int = _DEFAULT_MAX_WORKERS) -> in
             completed += 1
 
             if rows:
-                t0 = time.time()
+                t0 = time.monotonic()
                 inserted = db.insert_kalshi_daily_bulk(rows)
-                insert_elapsed = time.time() - t0
+                insert_elapsed = time.monotonic() - t0
                 total_rows += inserted
                 logger.info(
                     "  %s: %d records, fetch=%.1fs insert=%.1fs [%d/%d]",
@@ -217,9 +218,9 @@ def run_backfill() -> None:
     db = AgentDatabase(trading_config.db_path)
 
     try:
-        start = time.time()
+        start = time.monotonic()
         total = sync_daily(db)
-        elapsed = time.time() - start
+        elapsed = time.monotonic() - start
         logger.info("Backfill finished in %.1fs (%d rows)", elapsed, total)
     finally:
         db.close()
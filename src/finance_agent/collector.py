@@ -10,15 +10,18 @@ storing both event structure and market snapshots.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
 import time
 from datetime import UTC, datetime
 from typing import Any
 
+from .api_base import iter_pages
 from .config import load_configs
 from .constants import EXCHANGE_KALSHI, STATUS_OPEN
 from .database import AgentDatabase
+from .event_loop import run
 from .kalshi_client import KalshiAPIClient
 
 logger = logging.getLogger(__name__)
@@ -117,91 +120,95 @@ async def collect_kalshi(
     event_batch: list[dict[str, Any]] = []
     market_batch: list[dict[str, Any]] = []
     meta_batch: list[dict[str, Any]] = []
-    cursor: str | None = None
     pages = 0
 
-    while True:
-        try:
-            resp = await client.get_events(status=status, with_nested_markets=True, cursor=cursor)
-        except Exception as e:
-            logger.warning("Error during %s collection: %s", label, e)
-            break
-
-        events = resp.get("events", [])
-        if not events:
-            break
-
-        page_markets = 0
-        for event in events:
-            et = event.get("event_ticker")
-            if not et:
-                continue
-            nested = event.get("markets", [])
-            markets_summary = [
-                {
-                    "ticker": m.get("ticker"),
-                    "title": m.get("title"),
-                    "yes_bid": m.get("yes_bid"),
-                    "yes_ask": m.get("yes_ask"),
-                    "status": m.get("status"),
-                }
-                for m in nested
-            ]
-            event_batch.append(
-                {
-                    "event_ticker": et,
-                    "exchange": EXCHANGE_KALSHI,
-                    "series_ticker": event.get("series_ticker"),
-                    "title": event.get("title"),
-                    "category": event.get("category"),
-                    "mutually_exclusive": 1 if event.get("mutually_exclusive") else 0,
-                    "last_updated": now,
-                    "markets_json": json.dumps(markets_summary, default=str),
-                }
-            )
-            event_count += 1
-            for m in nested:
-                market_batch.append(_compute_derived(m, now))
-                meta_batch.append(
+    # Next page is fetched while this one is parsed and flushed (flushes run in a
+    # worker thread so the prefetch request can progress on the event loop).
+    page_iter = iter_pages(
+        client.get_events, status=status, with_nested_markets=True, max_pages=max_pages
+    )
+    async with contextlib.aclosing(page_iter):
+        while True:
+            try:
+                resp = await anext(page_iter, None)
+            except Exception as e:
+                logger.warning("Error during %s collection: %s", label, e)
+                break
+            if resp is None:
+                break
+
+            events = resp.get("events", [])
+            if not events:
+                break
+
+            page_markets = 0
+            for event in events:
+                et = event.get("event_ticker")
+                if not et:
+                    continue
+                nested = event.get("markets", [])
+                markets_summary = [
                     {
                         "ticker": m.get("ticker"),
+                        "title": m.get("title"),
+                        "yes_bid": m.get("yes_bid"),
+                        "yes_ask": m.get("yes_ask"),
+                        "status": m.get("status"),
+                    }
+                    for m in nested
+                ]
+                event_batch.append(
+                    {
                         "event_ticker": et,
+                        "exchange": EXCHANGE_KALSHI,
                         "series_ticker": event.get("series_ticker"),
-                        "title": m.get("title"),
+                        "title": event.get("title"),
                         "category": event.get("category"),
+                        "mutually_exclusive": 1 if event.get("mutually_exclusive") else 0,
+                        "last_updated": now,
+                        "markets_json": json.dumps(markets_summary, default=str),
                     }
                 )
-            page_markets += len(nested)
-
-        if len(event_batch) >= 500:
-            db.upsert_events_bulk(event_batch)
-            event_batch.clear()
-        if len(market_batch) >= 500:
-            market_count += db.insert_market_snapshots(market_batch)
-            market_batch.clear()
-        if len(meta_batch) >= 500:
-            db.upsert_market_meta(meta_batch)
-            meta_batch.clear()
-
-        pages += 1
-        logger.info(
-            "  page %d: %d events, %d markets (total: %d events, %d markets)",
-            pages,
-            len(events),
-            page_markets,
-            event_count,
-            market_count + len(market_batch),
-        )
-        cursor = resp.get("cursor")
-        if not cursor or (max_pages and pages >= max_pages):
-            break
+                event_count += 1
+                for m in nested:
+                    market_batch.append(_compute_derived(m, now))
+                    meta_batch.append(
+                        {
+                            "ticker": m.get("ticker"),
+                            "event_ticker": et,
+                            "series_ticker": event.get("series_ticker"),
+                            "title": m.get("title"),
+                            "category": event.get("category"),
+                        }
+                    )
+                page_markets += len(nested)
+
+            if len(event_batch) >= 500:
+                await asyncio.to_thread(db.upsert_events_bulk, event_batch)
+                event_batch.clear()
+            if len(market_batch) >= 500:
+                market_count += await asyncio.to_thread(db.insert_market_snapshots, market_batch)
+                market_batch.clear()
+            if len(meta_batch) >= 500:
+                await asyncio.to_thread(db.upsert_market_meta, meta_batch)
+                meta_batch.clear()
+
+            pages += 1
+            logger.info(
+                "  page %d: %d events, %d markets (total: %d events, %d markets)",
+                pages,
+                len(events),
+                page_markets,
+                event_count,
+                market_count + len(market_batch),
+            )
 
     if event_batch:
-        db.upsert_events_bulk(event_batch)
+        await asyncio.to_thread(db.upsert_events_bulk, event_batch)
     if market_batch:
-        market_count += db.insert_market_snapshots(market_batch)
+        market_count += await asyncio.to_thread(db.insert_market_snapshots, market_batch)
     if meta_batch:
-        db.upsert_market_meta(meta_batch)
+        await asyncio.to_thread(db.upsert_market_meta, meta_batch)
 
     logger.info("  -> %d events, %d market snapshots", event_count, market_count)
     return event_count, market_count
@@ -229,19 +236,19 @@ async def resolve_settlements(kalshi: KalshiAPIClient, db: AgentDatabase) -> int
         batch = tickers[i : i + batch_size]
         try:
             resp = await kalshi.search_markets(tickers=",".join(batch), limit=1000)
-            for market in resp.get("markets", []):
-                ticker = market.get("ticker")
-                settlement_value = market.get("settlement_value")
-                if ticker and settlement_value is not None:
-                    count = db.settle_legs(ticker, int(settlement_value))
-                    if count > 0:
-                        logger.info(
-                            "  Settled %s -> %dc (%d legs updated)",
-                            ticker,
-                            settlement_value,
-                            count,
-                        )
-                        settled_count += count
+            settlements = {
+                m["ticker"]: int(m["settlement_value"])
+                for m in resp.get("markets", [])
+                if m.get("ticker") and m.get("settlement_value") is not None
+            }
+            for ticker, count in db.settle_legs_bulk(settlements).items():
+                logger.info(
+                    "  Settled %s -> %dc (%d legs updated)",
+                    ticker,
+                    settlements[ticker],
+                    count,
+                )
+                settled_count += count
         except Exception as e:
             logger.debug("  Batch settlement check failed: %s", e)
 
@@ -275,7 +282,7 @@ async def _run_collector_async() -> None:
     kalshi = KalshiAPIClient(credentials, trading_config)
     db = AgentDatabase(trading_config.db_path)
 
-    start = time.time()
+    start = time.monotonic()
     logger.info("Data collector starting")
     logger.info("DB: %s", trading_config.db_path)
 
@@ -295,7 +302,7 @@ async def _run_collector_async() -> None:
         # Checkpoint and update statistics
         db.maintenance()
 
-        elapsed = time.time() - start
+        elapsed = time.monotonic() - start
         logger.info("Collection complete in %.1fs", elapsed)
         logger.info("  Kalshi: %d events (%d markets)", k_events, k_markets)
     except KeyboardInterrupt:
@@ -307,7 +314,7 @@ async def _run_collector_async() -> None:
 
 def run_collector() -> None:
     """Main entry point for the collector."""
-    asyncio.run(_run_collector_async())
+    run(_run_collector_async())
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ Everything else is a plain dataclass — edit this file to change defaults.
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -39,6 +40,7 @@ class TradingConfig:
     backup_max_age_hours: int = 24
     kalshi_rate_limit_reads_per_sec: int = 30  # Kalshi Basic tier
     kalshi_rate_limit_writes_per_sec: int = 30  # Kalshi Basic tier
+    kalshi_connection_pool_size: int = 32  # keep-alive connections reused across requests
     recommendation_ttl_minutes: int = 60
 
     execution_timeout_seconds: int = 300  # 5 min fill timeout for leg-in
@@ -63,6 +65,9 @@ class AgentConfig:
 
     model: str = "claude-sonnet-4-5-20250929"
     max_budget_usd: float = 50.0
+    # Largest single CLI message the SDK will buffer; nested-market tool results
+    # can exceed the SDK's 1 MB default
+    max_buffer_size: int = 8 * 1024 * 1024
     server_port: int = 8765
     workspace: str = "/workspace"
 
@@ -84,23 +89,30 @@ def load_configs() -> tuple[AgentConfig, Credentials, TradingConfig]:
     return ac, Credentials(), tc
 
 
+@functools.lru_cache(maxsize=8)
 def load_prompt(name: str) -> str:
-    """Load a prompt template from src/finance_agent/prompts/."""
+    """Load a prompt template from src/finance_agent/prompts/ (read once per process)."""
     prompt_dir = Path(__file__).parent / "prompts"
     return (prompt_dir / f"{name}.md").read_text(encoding="utf-8")
 
 
 def build_system_prompt(trading_config: TradingConfig) -> str:
     """Load system.md and substitute {{VARIABLE}} placeholders from config."""
+    variables = (
+        ("KALSHI_MAX_POSITION_USD", trading_config.kalshi_max_position_usd),
+        ("MAX_PORTFOLIO_USD", trading_config.max_portfolio_usd),
+        ("MAX_ORDER_COUNT", trading_config.max_order_count),
+        ("RECOMMENDATION_TTL_MINUTES", trading_config.recommendation_ttl_minutes),
+        ("EXECUTION_TIMEOUT_SECONDS", trading_config.execution_timeout_seconds),
+        ("MAX_SLIPPAGE_CENTS", trading_config.max_slippage_cents),
+    )
+    return _render_system_prompt(variables)
+
+
+@functools.lru_cache(maxsize=8)
+def _render_system_prompt(variables: tuple[tuple[str, object], ...]) -> str:
+    # Keyed on the substituted values: TradingConfig itself is mutable and unhashable
     raw = load_prompt("system")
-    variables = {
-        "KALSHI_MAX_POSITION_USD": trading_config.kalshi_max_position_usd,
-        "MAX_PORTFOLIO_USD": trading_config.max_portfolio_usd,
-        "MAX_ORDER_COUNT": trading_config.max_order_count,
-        "RECOMMENDATION_TTL_MINUTES": trading_config.recommendation_ttl_minutes,
-        "EXECUTION_TIMEOUT_SECONDS": trading_config.execution_timeout_seconds,
-        "MAX_SLIPPAGE_CENTS": trading_config.max_slippage_cents,
-    }
-    for name, value in variables.items():
+    for name, value in variables:
         raw = raw.replace(f"{{{{{name}}}}}", str(value))
     return raw
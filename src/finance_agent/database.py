@@ -181,7 +181,7 @@ class AgentDatabase:
         """Run database maintenance: checkpoint WAL, optionally reclaim storage."""
         import time
 
-        t0 = time.time()
+        t0 = time.monotonic()
         conn = self._engine.raw_connection()
         try:
             cursor = conn.cursor()
@@ -191,12 +191,12 @@ class AgentDatabase:
         finally:
             conn.close()
 
-        elapsed = time.time() - t0
+        elapsed = time.monotonic() - t0
         logger.info("Maintenance: checkpoint in %.1fs", elapsed)
 
         if vacuum:
             logger.info("Running VACUUM ANALYZE (this may take several minutes)...")
-            t0 = time.time()
+            t0 = time.monotonic()
             conn = self._engine.raw_connection()
             try:
                 cursor = conn.cursor()
@@ -205,7 +205,7 @@ class AgentDatabase:
                 conn.commit()
             finally:
                 conn.close()
-            logger.info("VACUUM ANALYZE completed in %.1fs", time.time() - t0)
+            logger.info("VACUUM ANALYZE completed in %.1fs", time.monotonic() - t0)
 
     # ── Market snapshot queries ─────────────────────────────────
 
@@ -357,6 +357,8 @@ class AgentDatabase:
                     price_cents=leg.get("price_cents"),
                     is_maker=leg.get("is_maker"),
                     orderbook_snapshot_json=leg.get("orderbook_snapshot_json"),
+                    yes_depth=leg.get("yes_depth"),
+                    no_depth=leg.get("no_depth"),
                 )
             )
 
@@ -446,19 +448,30 @@ class AgentDatabase:
 
     def settle_legs(self, ticker: str, settlement_value: int) -> int:
         """Mark all unresolved legs for a ticker as settled. Returns count updated."""
+        return self.settle_legs_bulk({ticker: settlement_value}).get(ticker, 0)
+
+    def settle_legs_bulk(self, settlements: dict[str, int]) -> dict[str, int]:
+        """Settle unresolved legs for many tickers in one transaction.
+
+        Returns {ticker: legs_updated} for tickers that had unresolved legs.
+        """
+        if not settlements:
+            return {}
         now = _now()
+        counts: dict[str, int] = {}
         with self._session_factory() as session:
             legs = session.scalars(
                 select(RecommendationLeg).where(
-                    RecommendationLeg.market_id == ticker,
+                    RecommendationLeg.market_id.in_(list(settlements)),
                     RecommendationLeg.settlement_value.is_(None),
                 )
             ).all()
             for leg in legs:
-                leg.settlement_value = settlement_value
+                leg.settlement_value = settlements[leg.market_id]
                 leg.settled_at = now
+                counts[leg.market_id] = counts.get(leg.market_id, 0) + 1
             session.commit()
-            return len(legs)
+        return counts
 
     def get_groups_pending_pnl(self) -> list[dict[str, Any]]:
         """Return groups where all legs are settled but P&L hasn't been computed."""
@@ -541,12 +554,14 @@ class AgentDatabase:
             return 0
         import time as _time
 
-        t0 = _time.time()
+        t0 = _time.monotonic()
         filtered = [{k: v for k, v in row.items() if k in self._SNAPSHOT_COLS} for row in rows]
         with self._session_factory() as session:
             session.execute(insert(MarketSnapshot), filtered)
             session.commit()
-        logger.info("insert_market_snapshots: %d rows in %.2fs", len(filtered), _time.time() - t0)
+        logger.info(
+            "insert_market_snapshots: %d rows in %.2fs", len(filtered), _time.monotonic() - t0
+        )
         return len(filtered)
 
     def purge_old_snapshots(self, retention_days: int = 7) -> int:
@@ -668,7 +683,7 @@ class AgentDatabase:
 
         import time as _time
 
-        t0 = _time.time()
+        t0 = _time.monotonic()
         cols_csv = ", ".join(columns)
         conflict_csv = ", ".join(conflict_columns)
 
@@ -710,7 +725,7 @@ class AgentDatabase:
         finally:
             tmp_path.unlink(missing_ok=True)
 
-        logger.info("bulk_upsert %s: %d rows in %.2fs", table, len(rows), _time.time() - t0)
+        logger.info("bulk_upsert %s: %d rows in %.2fs", table, len(rows), _time.monotonic() - t0)
         return len(rows)
 
     # ── Kalshi daily: insert / upsert ─────────────────────────
@@ -1096,7 +1111,7 @@ def run_backup() -> None:
 
 def run_startup() -> None:
     """CLI entry point: dump session state JSON."""
-    import json
+    import orjson
 
     from .config import load_configs
     from .logging_config import setup_logging
@@ -1107,6 +1122,6 @@ def run_startup() -> None:
     db = AgentDatabase(tc.db_path)
     try:
         state = db.get_session_state()
-        print(json.dumps(state, indent=2, default=str))  # noqa: T201
+        print(orjson.dumps(state, default=str, option=orjson.OPT_INDENT_2).decode())  # noqa: T201
     finally:
         db.close()
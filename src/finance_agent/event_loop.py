@@ -0,0 +1,20 @@
+"""Event loop selection for async entry points."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+
+def run[T](main: Coroutine[Any, Any, T]) -> T:
+    """``asyncio.run`` on uvloop when it is installed, else the default loop.
+
+    uvloop is a non-Windows dependency; Windows (and any env without it) keeps
+    the stdlib loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return asyncio.run(main, loop_factory=uvloop.new_event_loop)
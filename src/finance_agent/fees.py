@@ -5,22 +5,29 @@ Kalshi uses a P(1-P) parabolic formula — highest fees at 50c, near-zero at ext
 
 from __future__ import annotations
 
+import functools
 import json
 import math
 from typing import Any
 
 from .constants import (
     ACTION_BUY,
+    ACTION_SELL,
     BINARY_PAYOUT_CENTS,
+    SIDE_NO,
     SIDE_YES,
 )
 
 
+@functools.lru_cache(maxsize=8192)
 def kalshi_fee(contracts: int, price_cents: int, *, maker: bool = False) -> float:
     """Kalshi fee using P(1-P) formula. Returns fee in USD.
 
     Taker: ceil(0.07 * contracts * P * (1-P)), capped at $0.02/contract
     Maker: ceil(0.0175 * contracts * P * (1-P)), capped at $0.02/contract
+
+    Memoized (the schedule is fixed) -- pass ``maker`` as a bool so DB ``None``
+    values share the ``False`` cache entry.
     """
     if contracts <= 0 or not (1 <= price_cents <= 99):
         return 0.0
@@ -78,50 +85,59 @@ def compute_hypothetical_pnl(group: dict[str, Any]) -> float:
     return _pnl(group.get("legs", []))
 
 
+# (side_sign, settlement_basis): effective settlement = basis + sign * settlement.
+# NO-side inverts settlement (YES=100 means NO=0 and vice versa).
+_SIDE_FACTORS: dict[str, tuple[int, int]] = {
+    SIDE_YES: (1, 0),
+    SIDE_NO: (-1, BINARY_PAYOUT_CENTS),
+}
+_ACTION_SIGNS: dict[str, int] = {ACTION_BUY: 1, ACTION_SELL: -1}
+
+
 def _pnl(legs: list[dict[str, Any]]) -> float:
     """P&L for manual strategy: per-leg directional P&L minus fees."""
     total_pnl_cents = 0
     total_fees = 0.0
+    no_factors = _SIDE_FACTORS[SIDE_NO]
 
     for leg in legs:
         settlement = leg.get("settlement_value")
-        price = leg.get("price_cents", 0)
-        quantity = leg.get("quantity", 0)
-        action = leg.get("action", ACTION_BUY)
-        side = leg.get("side", SIDE_YES)
-
         if settlement is None:
             continue
 
-        # For NO-side: invert settlement (YES=100 means NO=0 and vice versa)
-        effective_settlement = (
-            settlement if side == SIDE_YES else (BINARY_PAYOUT_CENTS - settlement)
-        )
-
-        if action == ACTION_BUY:
-            leg_pnl = (effective_settlement - price) * quantity
-        else:
-            leg_pnl = (price - effective_settlement) * quantity
+        price = leg.get("price_cents", 0)
+        quantity = leg.get("quantity", 0)
+        side_sign, basis = _SIDE_FACTORS.get(leg.get("side", SIDE_YES), no_factors)
+        action_sign = _ACTION_SIGNS.get(leg.get("action", ACTION_BUY), -1)
 
-        total_pnl_cents += leg_pnl
-        total_fees += kalshi_fee(quantity, price, maker=leg.get("is_maker", False))
+        total_pnl_cents += action_sign * (basis + side_sign * settlement - price) * quantity
+        total_fees += kalshi_fee(quantity, price, maker=bool(leg.get("is_maker")))
 
     return round(total_pnl_cents / 100.0 - total_fees, 4)
 
 
 def assess_depth_concern(leg: dict[str, Any]) -> str | None:
-    """Return a warning if orderbook depth was less than quantity, or None."""
-    snapshot_json = leg.get("orderbook_snapshot_json")
-    if not snapshot_json:
-        return None
-    try:
-        snapshot = json.loads(snapshot_json) if isinstance(snapshot_json, str) else snapshot_json
-    except (json.JSONDecodeError, TypeError):
-        return None
+    """Return a warning if orderbook depth was less than quantity, or None.
 
-    quantity = leg.get("quantity", 0)
+    Reads the typed ``yes_depth``/``no_depth`` leg columns; legs logged before
+    those columns existed fall back to decoding ``orderbook_snapshot_json``.
+    """
     side = leg.get("side", SIDE_YES)
-    depth = snapshot.get(f"{side}_depth", 0) or 0
+    depth_key = f"{side}_depth"
+    depth = leg.get(depth_key)
+    if depth is None:
+        snapshot_json = leg.get("orderbook_snapshot_json")
+        if not snapshot_json:
+            return None
+        try:
+            snapshot = (
+                json.loads(snapshot_json) if isinstance(snapshot_json, str) else snapshot_json
+            )
+        except (json.JSONDecodeError, TypeError):
+            return None
+        depth = snapshot.get(depth_key, 0) or 0
+
+    quantity = leg.get("quantity", 0)
 
     if quantity > 0 and depth < quantity:
         return f"Depth {depth} < qty {quantity} on {side} side"
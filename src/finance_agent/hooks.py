@@ -2,42 +2,84 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import re
 from collections.abc import Callable
 from typing import Any
 
+import orjson
 from claude_agent_sdk import HookMatcher
 from claude_agent_sdk.types import HookContext, HookEvent, HookInput, HookJSONOutput
 
-from .kb_versioning import commit_kb
+from .kb_versioning import schedule_kb_commit
 
 logger = logging.getLogger(__name__)
 
 _EMPTY: HookJSONOutput = {}  # type: ignore[assignment]
+# Shared, never mutated -- the SDK copies hook output before sending it to the CLI
+_ALLOW: HookJSONOutput = {  # type: ignore[assignment]
+    "hookSpecificOutput": {
+        "hookEventName": "PreToolUse",
+        "permissionDecision": "allow",
+    }
+}
 # Container filesystem contract — agent cannot write to these (kernel-enforced :ro mount)
 _PROTECTED_PREFIXES = ("/workspace/data/", "/workspace/scripts/")
+# File-writing tools whose target path is checked against _PROTECTED_PREFIXES
+_FILE_WRITE_TOOLS = frozenset({"Write", "Edit"})
+# Shell operators that indicate a Bash command writes to the file it names
+_KB_WRITE_OPS_RE = re.compile(r">>| > |tee |mv |cp |sed ")
 
 
 def _is_tool_error(response: Any) -> bool:
-    """Check if an MCP tool response contains an error."""
-    if not response:
+    """Check if an MCP tool response contains an error.
+
+    Accepts the MCP result dict (``{"content": [{"type": "text", "text": ...}]}``),
+    a bare content list, or raw JSON text.
+    """
+    rtype = type(response)
+    if rtype is dict:
+        content = response.get("content")
+    elif rtype is list:
+        content = response
+    elif rtype is str:
+        return '"error"' in response
+    else:
         return False
-    try:
-        # MCP tool responses: {"content": [{"type": "text", "text": "..."}]}
-        if isinstance(response, dict):
-            for item in response.get("content", []):
-                if isinstance(item, dict) and item.get("type") == "text":
-                    parsed = json.loads(item["text"])
-                    if isinstance(parsed, dict) and "error" in parsed:
-                        return True
-        elif isinstance(response, str) and '"error"' in response:
+
+    for item in content or ():
+        if type(item) is not dict or item.get("type") != "text":
+            continue
+        text = item.get("text", "")
+        # Only decode when an "error" key could be present
+        if '"error"' not in text:
+            continue
+        try:
+            parsed = orjson.loads(text)
+        except orjson.JSONDecodeError:
+            continue
+        if type(parsed) is dict and "error" in parsed:
             return True
-    except (json.JSONDecodeError, KeyError, TypeError):
-        pass
     return False
 
 
+def _file_targets_kb(tool_input: dict[str, Any]) -> bool:
+    return tool_input.get("file_path", "").endswith("knowledge_base.md")
+
+
+def _bash_writes_kb(tool_input: dict[str, Any]) -> bool:
+    command = tool_input.get("command", "")
+    return "knowledge_base.md" in command and _KB_WRITE_OPS_RE.search(command) is not None
+
+
+# tool_name -> predicate on tool_input; tools not listed never write the KB
+_KB_WRITE_CHECKS: dict[str, Callable[[dict[str, Any]], bool]] = {
+    "Write": _file_targets_kb,
+    "Edit": _file_targets_kb,
+    "Bash": _bash_writes_kb,
+}
+
+
 def create_audit_hooks(
     on_recommendation: Callable[[], None] | None = None,
 ) -> dict[HookEvent, list[HookMatcher]]:
@@ -54,10 +96,10 @@ def create_audit_hooks(
             return _EMPTY
 
         # Block Write/Edit to read-only paths with helpful message
-        if tool_name in ("Write", "Edit"):
+        if tool_name in _FILE_WRITE_TOOLS:
             tool_input = data.get("tool_input", {})
             file_path = tool_input.get("file_path", "")
-            if any(file_path.startswith(p) for p in _PROTECTED_PREFIXES):
+            if file_path.startswith(_PROTECTED_PREFIXES):
                 return {  # type: ignore[return-value]
                     "hookSpecificOutput": {
                         "hookEventName": "PreToolUse",
@@ -70,12 +112,7 @@ def create_audit_hooks(
                     }
                 }
 
-        return {  # type: ignore[return-value]
-            "hookSpecificOutput": {
-                "hookEventName": "PreToolUse",
-                "permissionDecision": "allow",
-            }
-        }
+        return _ALLOW
 
     async def audit_recommendation(
         input_data: HookInput, _tool_use_id: str | None, _context: HookContext
@@ -96,23 +133,11 @@ def create_audit_hooks(
     async def commit_kb_if_written(
         input_data: HookInput, _tool_use_id: str | None, _context: HookContext
     ) -> HookJSONOutput:
-        """Auto-commit knowledge_base.md after agent writes to it."""
+        """Schedule a (debounced) commit of knowledge_base.md after agent writes to it."""
         data: dict[str, Any] = input_data  # type: ignore[assignment]
-        tool_name = data.get("tool_name", "")
-        tool_input = data.get("tool_input", {})
-
-        is_kb_write = False
-        if tool_name in ("Write", "Edit"):
-            file_path = tool_input.get("file_path", "")
-            is_kb_write = file_path.endswith("knowledge_base.md")
-        elif tool_name == "Bash":
-            command = tool_input.get("command", "")
-            is_kb_write = "knowledge_base.md" in command and any(
-                op in command for op in (">>", " > ", "tee ", "mv ", "cp ", "sed ")
-            )
-
-        if is_kb_write:
-            await commit_kb()
+        check = _KB_WRITE_CHECKS.get(data.get("tool_name", ""))
+        if check is not None and check(data.get("tool_input", {})):
+            schedule_kb_commit()
         return _EMPTY
 
     return {
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-import json
+import copy
+import functools
 import logging
 import time
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Any
 
+import orjson
 from kalshi_python_async import Configuration, KalshiClient
 
 from .api_base import BaseAPIClient
@@ -15,12 +18,30 @@ from .config import Credentials, TradingConfig
 
 logger = logging.getLogger(__name__)
 
+# Response TTLs (seconds) for reads the agent repeats within a turn.  Orderbooks,
+# portfolio and order reads are never cached -- execution relies on them being live.
+_MARKET_TTL = 2.0
+_EVENT_TTL = 30.0
+_EXCHANGE_STATUS_TTL = 10.0  # short: a trading halt must surface before the next order
+_CACHE_MAX_ENTRIES = 1024
+
 
 def _optional(**kwargs: Any) -> dict[str, Any]:
-    """Return only non-None keyword arguments."""
+    """Return only non-None keyword arguments.
+
+    Callers pass required and optional SDK arguments together so each request
+    builds its kwargs in one pass (required values are never None).
+    """
     return {k: v for k, v in kwargs.items() if v is not None}
 
 
+@functools.lru_cache(maxsize=8)
+def _read_pem(path: str, mtime_ns: int) -> str:
+    """Read a private key file, cached per (path, mtime) across client rebuilds."""
+    with Path(path).open() as f:
+        return f.read()
+
+
 class KalshiAPIClient(BaseAPIClient):
     """Convenience wrapper providing typed methods around the Kalshi SDK."""
 
@@ -31,20 +52,44 @@ class KalshiAPIClient(BaseAPIClient):
         )
         self._config = config
         self._client = self._build_client(credentials, config)
+        self._cache: dict[tuple[Any, ...], tuple[float, Any]] = {}
+        self._clock = time.monotonic
 
     @staticmethod
     def _build_client(credentials: Credentials, config: TradingConfig) -> KalshiClient:
         cfg = Configuration(host=config.kalshi_api_url)
         cfg.api_key_id = credentials.kalshi_api_key_id
+        # The SDK keeps one aiohttp session; cap its pool near the rate limit so
+        # request bursts queue on warm keep-alive connections instead of opening
+        # new TLS connections.
+        cfg.connection_pool_maxsize = config.kalshi_connection_pool_size
 
         if credentials.kalshi_private_key:
             cfg.private_key_pem = credentials.kalshi_private_key.replace("\\n", "\n")
         else:
-            with Path(credentials.kalshi_private_key_path).open() as f:
-                cfg.private_key_pem = f.read()
+            key_path = credentials.kalshi_private_key_path
+            cfg.private_key_pem = _read_pem(key_path, Path(key_path).stat().st_mtime_ns)
 
         return KalshiClient(cfg)
 
+    async def _cached_read(
+        self, key: tuple[Any, ...], ttl: float, call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return a cached response younger than ``ttl``; hits skip the rate limiter.
+
+        The cache keeps its own deep copy and every hit returns a fresh one, so
+        callers (tools annotating market dicts) can't alter the cached entry.
+        """
+        now = self._clock()
+        hit = self._cache.get(key)
+        if hit is not None and hit[0] > now:
+            return copy.deepcopy(hit[1])
+        result = await self._read(call())
+        if len(self._cache) >= _CACHE_MAX_ENTRIES:
+            self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+        self._cache[key] = (now + ttl, copy.deepcopy(result))
+        return result
+
     # -- Market data (read) --
 
     async def search_markets(
@@ -58,23 +103,23 @@ class KalshiAPIClient(BaseAPIClient):
         limit: int = 50,
         cursor: str | None = None,
     ) -> dict[str, Any]:
-        kwargs: dict[str, Any] = {
-            "limit": limit,
-            **_optional(
-                status=status,
-                series_ticker=series_ticker,
-                event_ticker=event_ticker,
-                tickers=tickers,
-                cursor=cursor,
-            ),
-        }
+        kwargs = _optional(
+            limit=limit,
+            status=status,
+            series_ticker=series_ticker,
+            event_ticker=event_ticker,
+            tickers=tickers,
+            cursor=cursor,
+        )
         # NOTE: Kalshi API v2 removed the keyword search `query` param from
         # GET /markets.  The `query` param is accepted here for interface
         # compatibility but is silently ignored.
         return await self._read(self._client.get_markets(**kwargs))
 
     async def get_market(self, ticker: str) -> dict[str, Any]:
-        return await self._read(self._client.get_market(ticker))
+        return await self._cached_read(
+            ("market", ticker), _MARKET_TTL, lambda: self._client.get_market(ticker)
+        )
 
     async def get_orderbook(self, ticker: str, depth: int = 10) -> dict[str, Any]:
         try:
@@ -86,14 +131,15 @@ class KalshiAPIClient(BaseAPIClient):
             await self._rate_read()
             api = self._client._market_api
             resp = await api.get_market_orderbook_without_preload_content(ticker, depth=depth)
-            body = await resp.text()
-            return json.loads(body)
+            return orjson.loads(await resp.read())
 
     async def get_event(
         self, event_ticker: str, with_nested_markets: bool = True
     ) -> dict[str, Any]:
-        return await self._read(
-            self._client.get_event(event_ticker, with_nested_markets=with_nested_markets)
+        return await self._cached_read(
+            ("event", event_ticker, with_nested_markets),
+            _EVENT_TTL,
+            lambda: self._client.get_event(event_ticker, with_nested_markets=with_nested_markets),
         )
 
     async def get_trades(
@@ -103,7 +149,7 @@ class KalshiAPIClient(BaseAPIClient):
         limit: int = 50,
         cursor: str | None = None,
     ) -> dict[str, Any]:
-        kwargs: dict[str, Any] = {"limit": limit, **_optional(ticker=ticker, cursor=cursor)}
+        kwargs = _optional(limit=limit, ticker=ticker, cursor=cursor)
         return await self._read(self._client.get_trades(**kwargs))
 
     async def get_candlesticks(
@@ -114,12 +160,17 @@ class KalshiAPIClient(BaseAPIClient):
         end_ts: int | None = None,
         period_interval: int = 60,
     ) -> dict[str, Any]:
-        now = int(time.time())
+        if start_ts is None or end_ts is None:
+            now = int(time.time())
+            if end_ts is None:
+                end_ts = now
+            if start_ts is None:
+                start_ts = now - 86400
         return await self._read(
             self._client.batch_get_market_candlesticks(
                 market_tickers=ticker,
-                start_ts=start_ts if start_ts is not None else now - 86400,
-                end_ts=end_ts if end_ts is not None else now,
+                start_ts=start_ts,
+                end_ts=end_ts,
                 period_interval=period_interval,
             )
         )
@@ -137,11 +188,13 @@ class KalshiAPIClient(BaseAPIClient):
         limit: int = 100,
         cursor: str | None = None,
     ) -> dict[str, Any]:
-        kwargs: dict[str, Any] = {
-            "limit": limit,
-            "count_filter": "position",
-            **_optional(ticker=ticker, event_ticker=event_ticker, cursor=cursor),
-        }
+        kwargs = _optional(
+            limit=limit,
+            count_filter="position",
+            ticker=ticker,
+            event_ticker=event_ticker,
+            cursor=cursor,
+        )
         return await self._read(self._client.get_positions(**kwargs))
 
     async def get_fills(
@@ -151,7 +204,7 @@ class KalshiAPIClient(BaseAPIClient):
         limit: int = 100,
         cursor: str | None = None,
     ) -> dict[str, Any]:
-        kwargs: dict[str, Any] = {"limit": limit, **_optional(ticker=ticker, cursor=cursor)}
+        kwargs = _optional(limit=limit, ticker=ticker, cursor=cursor)
         return await self._read(self._client.get_fills(**kwargs))
 
     async def get_settlements(
@@ -160,7 +213,7 @@ class KalshiAPIClient(BaseAPIClient):
         limit: int = 100,
         cursor: str | None = None,
     ) -> dict[str, Any]:
-        kwargs: dict[str, Any] = {"limit": limit, **_optional(cursor=cursor)}
+        kwargs = _optional(limit=limit, cursor=cursor)
         return await self._read(self._client.get_settlements(**kwargs))
 
     # -- Orders (write) --
@@ -172,7 +225,7 @@ class KalshiAPIClient(BaseAPIClient):
         status: str | None = None,
         limit: int = 100,
     ) -> dict[str, Any]:
-        kwargs: dict[str, Any] = {"limit": limit, **_optional(ticker=ticker, status=status)}
+        kwargs = _optional(limit=limit, ticker=ticker, status=status)
         return await self._read(self._client.get_orders(**kwargs))
 
     async def create_order(
@@ -188,19 +241,17 @@ class KalshiAPIClient(BaseAPIClient):
         client_order_id: str | None = None,
         expiration_ts: int | None = None,
     ) -> dict[str, Any]:
-        kwargs = {
-            "ticker": ticker,
-            "action": action,
-            "side": side,
-            "count": count,
-            "type": order_type,
-            **_optional(
-                yes_price=yes_price,
-                no_price=no_price,
-                client_order_id=client_order_id,
-                expiration_ts=expiration_ts,
-            ),
-        }
+        kwargs = _optional(
+            ticker=ticker,
+            action=action,
+            side=side,
+            count=count,
+            type=order_type,
+            yes_price=yes_price,
+            no_price=no_price,
+            client_order_id=client_order_id,
+            expiration_ts=expiration_ts,
+        )
         return await self._write(self._client.create_order(**kwargs))
 
     async def cancel_order(self, order_id: str) -> dict[str, Any]:
@@ -209,7 +260,9 @@ class KalshiAPIClient(BaseAPIClient):
     # -- Exchange status --
 
     async def get_exchange_status(self) -> dict[str, Any]:
-        return await self._read(self._client.get_exchange_status())
+        return await self._cached_read(
+            ("exchange_status",), _EXCHANGE_STATUS_TTL, self._client.get_exchange_status
+        )
 
     # -- Historical data --
 
@@ -221,10 +274,7 @@ class KalshiAPIClient(BaseAPIClient):
         event_ticker: str | None = None,
         tickers: str | None = None,
     ) -> dict[str, Any]:
-        kwargs: dict[str, Any] = {
-            "limit": limit,
-            **_optional(cursor=cursor, event_ticker=event_ticker, tickers=tickers),
-        }
+        kwargs = _optional(limit=limit, cursor=cursor, event_ticker=event_ticker, tickers=tickers)
         return await self._read(self._client._historical_api.get_historical_markets(**kwargs))
 
     async def get_historical_market(self, ticker: str) -> dict[str, Any]:
@@ -243,9 +293,10 @@ class KalshiAPIClient(BaseAPIClient):
         limit: int = 200,
         cursor: str | None = None,
     ) -> dict[str, Any]:
-        kwargs: dict[str, Any] = {
-            "limit": limit,
-            "with_nested_markets": with_nested_markets,
-            **_optional(status=status, cursor=cursor),
-        }
+        kwargs = _optional(
+            limit=limit,
+            with_nested_markets=with_nested_markets,
+            status=status,
+            cursor=cursor,
+        )
         return await self._read(self._client.get_events(**kwargs))
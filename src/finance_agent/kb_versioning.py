@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +17,19 @@ _KB_PATH = "workspace/analysis/knowledge_base.md"
 _GIT_USER = "Finance Agent"
 _GIT_EMAIL = "agent@local"
 _git_available: bool | None = None
+# (repo_dir, sha) -> KB content; a commit's blob never changes, so entries never go stale
+_version_cache: dict[tuple[str, str], str] = {}
+_VERSION_CACHE_MAX = 64
+# Edits within this window share one commit
+_COMMIT_DEBOUNCE_SECONDS = 5.0
+# (task, flush event) for the scheduled commit that has not started yet
+_pending_commit: tuple[asyncio.Task[bool], asyncio.Event] | None = None
+# Every scheduled commit task until it finishes (waiting or running git), so
+# flush_kb_commit can await in-flight commits and tasks are never GC'd early
+_commit_tasks: set[asyncio.Task[bool]] = set()
+# (loop, lock); created lazily so each event loop gets its own lock
+_commit_lock: tuple[asyncio.AbstractEventLoop, asyncio.Lock] | None = None
+_git_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="kb-git")
 
 
 @dataclass
@@ -22,31 +39,49 @@ class KBVersion:
     message: str
 
 
+def _run_git_sync(cmd: list[str], subcommand: str) -> tuple[int, str]:
+    proc = subprocess.run(cmd, capture_output=True, check=False)  # noqa: S603
+    if proc.returncode != 0 and proc.stderr:
+        logger.debug("git %s stderr: %s", subcommand, proc.stderr.decode(errors="replace").strip())
+    return proc.returncode, proc.stdout.decode(errors="replace").strip()
+
+
 async def _run_git(*args: str, cwd: str = _REPO_DIR) -> tuple[int, str]:
-    """Run a git command and return (returncode, stdout)."""
+    """Run a git command and return (returncode, stdout).
+
+    Runs a blocking ``subprocess.run`` on a small dedicated pool: cheaper than
+    asyncio subprocess transports for short commands, and git never occupies
+    the default executor.
+    """
     cmd = ["git", "-C", cwd, "-c", f"user.name={_GIT_USER}", "-c", f"user.email={_GIT_EMAIL}"]
     cmd.extend(args)
     try:
-        proc = await asyncio.create_subprocess_exec(
-            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await proc.communicate()
-        if proc.returncode != 0 and stderr:
-            logger.debug("git %s stderr: %s", args[0], stderr.decode(errors="replace").strip())
-        return proc.returncode or 0, stdout.decode(errors="replace").strip()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_git_executor, _run_git_sync, cmd, args[0])
     except Exception:
         logger.debug("git command failed: %s", " ".join(cmd), exc_info=True)
         return 1, ""
 
 
+async def _detect_git(repo_dir: str) -> bool:
+    """True if ``repo_dir`` is in a git work tree.
+
+    A ``.git`` directory (or worktree gitfile) at the root answers with one stat;
+    ``rev-parse`` is only needed when the repo root is an ancestor.
+    """
+    if (Path(repo_dir) / ".git").exists():
+        return True
+    rc, _ = await _run_git("rev-parse", "--git-dir", cwd=repo_dir)
+    return rc == 0
+
+
 async def commit_kb(repo_dir: str = _REPO_DIR) -> bool:
     """Stage and commit knowledge_base.md. Returns True if a commit was created."""
     global _git_available
     if _git_available is False:
         return False
     if _git_available is None:
-        rc, _ = await _run_git("rev-parse", "--git-dir", cwd=repo_dir)
-        _git_available = rc == 0
+        _git_available = await _detect_git(repo_dir)
         if not _git_available:
             logger.info("Git repo not available at %s, KB versioning disabled", repo_dir)
             return False
@@ -71,6 +106,48 @@ async def commit_kb(repo_dir: str = _REPO_DIR) -> bool:
     return True
 
 
+def schedule_kb_commit(repo_dir: str = _REPO_DIR, delay: float = _COMMIT_DEBOUNCE_SECONDS) -> None:
+    """Commit knowledge_base.md after ``delay`` seconds, coalescing repeated edits.
+
+    Edits made while a commit is waiting join it; edits made once it has started
+    schedule a new one.  Call ``flush_kb_commit`` on shutdown.
+    """
+    global _pending_commit
+    if _pending_commit is not None:
+        return
+    flush = asyncio.Event()
+    task = asyncio.create_task(_commit_after(repo_dir, delay, flush))
+    _commit_tasks.add(task)
+    task.add_done_callback(_commit_tasks.discard)
+    _pending_commit = (task, flush)
+
+
+def _get_commit_lock() -> asyncio.Lock:
+    global _commit_lock
+    loop = asyncio.get_running_loop()
+    if _commit_lock is None or _commit_lock[0] is not loop:
+        _commit_lock = (loop, asyncio.Lock())
+    return _commit_lock[1]
+
+
+async def _commit_after(repo_dir: str, delay: float, flush: asyncio.Event) -> bool:
+    global _pending_commit
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(flush.wait(), timeout=delay)
+    # Later edits need a new commit; this task stays in _commit_tasks until done
+    _pending_commit = None
+    async with _get_commit_lock():
+        return await commit_kb(repo_dir)
+
+
+async def flush_kb_commit() -> None:
+    """Run a scheduled KB commit immediately and wait for all in-flight commits."""
+    if _pending_commit is not None:
+        _pending_commit[1].set()
+    if _commit_tasks:
+        await asyncio.gather(*_commit_tasks, return_exceptions=True)
+
+
 async def get_versions(repo_dir: str = _REPO_DIR, limit: int = 50) -> list[KBVersion]:
     """Get git log for knowledge_base.md."""
     rc, output = await _run_git(
@@ -93,8 +170,15 @@ async def get_versions(repo_dir: str = _REPO_DIR, limit: int = 50) -> list[KBVer
 
 
 async def get_version_content(sha: str, repo_dir: str = _REPO_DIR) -> str | None:
-    """Get knowledge_base.md content at a specific commit."""
+    """Get knowledge_base.md content at a specific commit (cached per sha)."""
+    key = (repo_dir, sha)
+    cached = _version_cache.get(key)
+    if cached is not None:
+        return cached
     rc, output = await _run_git("show", f"{sha}:{_KB_PATH}", cwd=repo_dir)
     if rc != 0:
         return None
+    if len(_version_cache) >= _VERSION_CACHE_MAX:
+        del _version_cache[next(iter(_version_cache))]
+    _version_cache[key] = output
     return output
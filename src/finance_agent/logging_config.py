@@ -6,11 +6,35 @@ Library modules use: logger = logging.getLogger(__name__)
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders ``asctime`` at most once per wall-clock second.
+
+    ``datefmt`` has one-second resolution, so records logged within the same
+    second share one ``strftime`` result.
+    """
+
+    def __init__(self, fmt: str, datefmt: str) -> None:
+        super().__init__(fmt, datefmt=datefmt)
+        self._time_cache: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:  # noqa: N802
+        sec = int(record.created)
+        cached_sec, cached = self._time_cache
+        if sec != cached_sec:
+            cached = time.strftime(datefmt or self.datefmt or "", self.converter(sec))
+            self._time_cache = (sec, cached)
+        return cached
+
+
 def setup_logging(
     *,
     level: int = logging.INFO,
@@ -36,7 +60,13 @@ def setup_logging(
         return
 
     root.setLevel(level)
-    formatter = logging.Formatter(fmt, datefmt=datefmt)
+    formatter = _CachedTimeFormatter(fmt, datefmt)
+
+    # Our formats never show thread/process/task names; skip collecting them per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False  # type: ignore[attr-defined]  # 3.12+, not in typeshed
 
     if console:
         handler = logging.StreamHandler(sys.stderr)
@@ -44,14 +74,21 @@ def setup_logging(
         handler.setFormatter(formatter)
         root.addHandler(handler)
 
-    # Optional file handler
+    # Optional file handler, written from a background thread: callers only pay
+    # for a queue put, the listener does the disk I/O.
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(str(log_path), encoding="utf-8")
         file_handler.setLevel(logging.DEBUG)  # file gets everything
         file_handler.setFormatter(formatter)
-        root.addHandler(file_handler)
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)  # drain remaining records on exit
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(logging.DEBUG)
+        root.addHandler(queue_handler)
 
     # Quiet noisy libraries
     logging.getLogger("alembic").setLevel(logging.WARNING)
@@ -78,7 +115,7 @@ def add_session_file_handler(
 
     handler = logging.FileHandler(str(log_path), encoding="utf-8")
     handler.setLevel(level)
-    handler.setFormatter(logging.Formatter(fmt, datefmt=datefmt))
+    handler.setFormatter(_CachedTimeFormatter(fmt, datefmt))
 
     root = logging.getLogger()
     root.addHandler(handler)
@@ -17,13 +17,15 @@ from claude_agent_sdk import ClaudeAgentOptions
 from claude_agent_sdk.types import HookEvent, HookMatcher
 
 _original_parse = _mp.parse_message
+_UNKNOWN_MESSAGE_TYPE = "Unknown message type"
 
 
 def _tolerant_parse(data):  # type: ignore[no-untyped-def]
     try:
         return _original_parse(data)
     except _mp.MessageParseError as e:
-        if "Unknown message type" in str(e):
+        # The SDK raises with the message as args[0]; prefix check, no str(e)
+        if e.args and e.args[0].startswith(_UNKNOWN_MESSAGE_TYPE):
             return None
         raise
 
@@ -64,6 +66,7 @@ def build_options(
         can_use_tool=can_use_tool,
         hooks=hooks,
         max_budget_usd=agent_config.max_budget_usd,
+        max_buffer_size=agent_config.max_buffer_size,
         sandbox={"enabled": True, "autoAllowBashIfSandboxed": True},
     )
 
@@ -19,15 +19,25 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import contextlib
+import functools
 import logging
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from .api_base import iter_pages
 from .config import load_configs
-from .database import AgentDatabase
-from .kalshi_client import KalshiAPIClient
+from .event_loop import run
 from .logging_config import setup_logging
 
+if TYPE_CHECKING:
+    # Imported at call time (main() after argument parsing) so ``--help`` and
+    # bad-argument exits don't pay for SQLAlchemy/DuckDB and the Kalshi SDK.
+    from sqlalchemy import TextClause
+
+    from .database import AgentDatabase
+    from .kalshi_client import KalshiAPIClient
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,6 +55,28 @@ def _extract_meta(market: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+@functools.cache
+def _missing_tickers_sql(with_prefix: bool, with_min_days: bool) -> TextClause:
+    """One of the four ``_get_missing_tickers`` statements, built once per variant."""
+    from sqlalchemy import text
+
+    # NOT EXISTS plans as a hash anti-join; LEFT JOIN ... IS NULL materializes
+    # the outer join and filters it afterwards.
+    conditions = ["NOT EXISTS (SELECT 1 FROM kalshi_market_meta m WHERE m.ticker = d.ticker_name)"]
+    if with_prefix:
+        conditions.append("d.ticker_name LIKE :prefix")
+    having = "HAVING COUNT(*) >= :min_days" if with_min_days else ""
+
+    where_sql = " AND ".join(conditions)
+    return text(
+        "SELECT d.ticker_name"  # noqa: S608
+        " FROM kalshi_daily d"
+        f" WHERE {where_sql}"
+        f" GROUP BY d.ticker_name {having}"
+        " ORDER BY COUNT(*) DESC"
+    )
+
+
 def _get_missing_tickers(
     db: AgentDatabase,
     *,
@@ -52,29 +84,12 @@ def _get_missing_tickers(
     min_days: int = 0,
 ) -> list[str]:
     """Return ticker_names from kalshi_daily that have no kalshi_market_meta entry."""
-    from sqlalchemy import text
-
-    conditions = ["m.ticker IS NULL"]
     params: dict[str, Any] = {}
-
     if prefix:
-        conditions.append("d.ticker_name LIKE :prefix")
         params["prefix"] = prefix
-
-    having = ""
     if min_days > 0:
-        having = "HAVING COUNT(*) >= :min_days"
         params["min_days"] = min_days
-
-    where_sql = " AND ".join(conditions)
-    sql = text(
-        "SELECT d.ticker_name"  # noqa: S608
-        " FROM kalshi_daily d"
-        " LEFT JOIN kalshi_market_meta m ON d.ticker_name = m.ticker"
-        f" WHERE {where_sql}"
-        f" GROUP BY d.ticker_name {having}"
-        " ORDER BY COUNT(*) DESC"
-    )
+    sql = _missing_tickers_sql(bool(prefix), min_days > 0)
 
     with db._session_factory() as session:
         rows = session.execute(sql, params).fetchall()
@@ -107,44 +122,42 @@ async def _phase_historical(
 
     total_fetched = 0
     total_upserted = 0
-    cursor: str | None = None
     pages = 0
     meta_batch: list[dict[str, Any]] = []
-    start = time.time()
-
-    while True:
-        resp = await kalshi.get_historical_markets(limit=1000, cursor=cursor)
-        markets = resp.get("markets", [])
-        if not markets:
-            break
-
-        meta_batch.extend(_extract_meta(m) for m in markets)
-        total_fetched += len(markets)
-        pages += 1
-
-        # Flush every 5000 markets
-        if len(meta_batch) >= 5000:
-            total_upserted += db.upsert_market_meta(meta_batch)
-            meta_batch.clear()
-
-        if pages % 20 == 0:
-            elapsed = time.time() - start
-            logger.info(
-                "  Historical: page %d, %d markets fetched (%.0fs)",
-                pages,
-                total_fetched,
-                elapsed,
-            )
-
-        cursor = resp.get("cursor")
-        if not cursor:
-            break
+    start = time.monotonic()
+
+    # The next page is fetched while this one is extracted and flushed (flushes
+    # run in a worker thread so the prefetch request progresses on the loop).
+    page_iter = iter_pages(kalshi.get_historical_markets, limit=1000)
+    async with contextlib.aclosing(page_iter):
+        async for resp in page_iter:
+            markets = resp.get("markets", [])
+            if not markets:
+                break
+
+            meta_batch.extend(_extract_meta(m) for m in markets)
+            total_fetched += len(markets)
+            pages += 1
+
+            # Flush every 5000 markets
+            if len(meta_batch) >= 5000:
+                total_upserted += await asyncio.to_thread(db.upsert_market_meta, meta_batch)
+                meta_batch.clear()
+
+            if pages % 20 == 0:
+                elapsed = time.monotonic() - start
+                logger.info(
+                    "  Historical: page %d, %d markets fetched (%.0fs)",
+                    pages,
+                    total_fetched,
+                    elapsed,
+                )
 
     # Final flush
     if meta_batch:
-        total_upserted += db.upsert_market_meta(meta_batch)
+        total_upserted += await asyncio.to_thread(db.upsert_market_meta, meta_batch)
 
-    elapsed = time.time() - start
+    elapsed = time.monotonic() - start
     logger.info(
         "Historical phase complete in %.1fs: %d fetched, %d upserted, %d pages",
         elapsed,
@@ -158,6 +171,7 @@ async def _phase_historical(
 # ── Phase 2: Live API batched ────────────────────────────────
 
 _BATCH_SIZE = 200  # Tickers per GET /markets call (URL length safe)
+_LIVE_CONCURRENCY = 8  # In-flight GET /markets batches
 
 
 async def _phase_live(
@@ -173,7 +187,9 @@ async def _phase_live(
     Sends up to 200 tickers per API call using the ``tickers`` parameter.
     Returns (tickers_requested, markets_upserted, errors).
     """
-    missing = _get_missing_tickers(db, prefix=prefix, min_days=min_days)
+    # GROUP BY already yields unique tickers; dedupe anyway (order-preserving)
+    # so a query change can never spend API calls on repeats.
+    missing = list(dict.fromkeys(_get_missing_tickers(db, prefix=prefix, min_days=min_days)))
     total = len(missing)
     n_batches = (total + _BATCH_SIZE - 1) // _BATCH_SIZE
 
@@ -196,47 +212,54 @@ async def _phase_live(
     errors = 0
     fetched = 0
     meta_batch: list[dict[str, Any]] = []
-    start = time.time()
+    start = time.monotonic()
 
     # Build all batch ticker lists upfront
     batches = [missing[i : i + _BATCH_SIZE] for i in range(0, total, _BATCH_SIZE)]
 
     # Fetch batches concurrently (semaphore limits in-flight requests;
     # the token-bucket rate limiter in api_base.py still paces individual calls)
-    sem = asyncio.Semaphore(5)
+    # and consume them as they complete, so metadata is flushed incrementally
+    # instead of after the slowest batch.
+    sem = asyncio.Semaphore(_LIVE_CONCURRENCY)
 
-    async def _fetch_batch(batch_tickers: list[str]) -> dict[str, Any]:
+    async def _fetch_batch(
+        batch_idx: int, batch_tickers: list[str]
+    ) -> tuple[int, dict[str, Any] | BaseException]:
         async with sem:
-            return await kalshi.search_markets(tickers=",".join(batch_tickers), limit=1000)
-
-    results = await asyncio.gather(
-        *[_fetch_batch(b) for b in batches],
-        return_exceptions=True,
-    )
-
-    for batch_idx, result in enumerate(results):
+            try:
+                return batch_idx, await kalshi.search_markets(
+                    tickers=",".join(batch_tickers), limit=1000
+                )
+            except Exception as e:
+                return batch_idx, e
+
+    for done, next_result in enumerate(
+        asyncio.as_completed([_fetch_batch(i, b) for i, b in enumerate(batches)]), 1
+    ):
+        batch_idx, result = await next_result
         if isinstance(result, BaseException):
             errors += 1
             if errors <= 10:
                 logger.warning("Batch %d failed: %s", batch_idx, result)
             elif errors == 11:
                 logger.warning("Suppressing further error details...")
-            logger.debug("Batch %d traceback", batch_idx, exc_info=True)
-            continue
-
-        markets = result.get("markets", [])
-        meta_batch.extend(_extract_meta(m) for m in markets)
-        fetched += len(markets)
-
-        # Flush every 5000 markets
-        if len(meta_batch) >= 5000:
-            upserted += db.upsert_market_meta(meta_batch)
-            meta_batch.clear()
+            logger.debug("Batch %d traceback", batch_idx, exc_info=result)
+        else:
+            markets = result.get("markets", [])
+            meta_batch.extend(_extract_meta(m) for m in markets)
+            fetched += len(markets)
+
+            # Flush every 5000 markets (in a worker thread, so in-flight batch
+            # requests keep progressing on the event loop)
+            if len(meta_batch) >= 5000:
+                upserted += await asyncio.to_thread(db.upsert_market_meta, meta_batch)
+                meta_batch.clear()
 
         # Progress logging
-        if (batch_idx + 1) % 50 == 0 or batch_idx == n_batches - 1:
-            elapsed = time.time() - start
-            tickers_done = min((batch_idx + 1) * _BATCH_SIZE, total)
+        if done % 50 == 0 or done == n_batches:
+            elapsed = time.monotonic() - start
+            tickers_done = min(done * _BATCH_SIZE, total)
             rate = tickers_done / elapsed if elapsed > 0 else 0
             remaining = (total - tickers_done) / rate if rate > 0 else 0
             logger.info(
@@ -244,16 +267,16 @@ async def _phase_live(
                 tickers_done,
                 total,
                 fetched,
-                batch_idx + 1,
+                done,
                 elapsed,
                 remaining,
             )
 
     # Final flush
     if meta_batch:
-        upserted += db.upsert_market_meta(meta_batch)
+        upserted += await asyncio.to_thread(db.upsert_market_meta, meta_batch)
 
-    elapsed = time.time() - start
+    elapsed = time.monotonic() - start
     logger.info(
         "Live phase complete in %.1fs: %d requested, %d fetched, %d upserted, %d batch errors",
         elapsed,
@@ -312,6 +335,9 @@ def main() -> None:
     )
     args = parser.parse_args()
 
+    from .database import AgentDatabase
+    from .kalshi_client import KalshiAPIClient
+
     setup_logging()
 
     _, creds, trading_config = load_configs()
@@ -337,7 +363,7 @@ def main() -> None:
             await kalshi._client.close()
             db.close()
 
-    asyncio.run(_run())
+    run(_run())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,25 @@
+"""Add yes_depth/no_depth columns to recommendation_legs.
+
+Stores the orderbook depth captured at recommendation time as typed
+columns so depth checks don't have to decode orderbook_snapshot_json.
+
+Revision ID: 0010
+Revises: 0009
+"""
+
+from alembic import op
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE recommendation_legs ADD COLUMN yes_depth INTEGER")
+    op.execute("ALTER TABLE recommendation_legs ADD COLUMN no_depth INTEGER")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE recommendation_legs DROP COLUMN no_depth")
+    op.execute("ALTER TABLE recommendation_legs DROP COLUMN yes_depth")
@@ -213,6 +213,8 @@ class RecommendationLeg(Base):
     fill_price_cents: Mapped[int | None] = mapped_column(Integer)
     fill_quantity: Mapped[int | None] = mapped_column(Integer)
     orderbook_snapshot_json: Mapped[str | None] = mapped_column(Text)
+    yes_depth: Mapped[int | None] = mapped_column(Integer)
+    no_depth: Mapped[int | None] = mapped_column(Integer)
     settlement_value: Mapped[int | None] = mapped_column(Integer)
     settled_at: Mapped[str | None] = mapped_column(Text)
 
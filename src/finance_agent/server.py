@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
+import functools
 import logging
 import signal
 import uuid
@@ -12,6 +12,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
 import websockets
 import websockets.asyncio.server
 from claude_agent_sdk import (
@@ -24,12 +25,13 @@ from claude_agent_sdk import (
     UserMessage,
     create_sdk_mcp_server,
 )
-from claude_agent_sdk.types import PermissionResultAllow
+from claude_agent_sdk.types import McpSdkServerConfig, PermissionResultAllow
 
 from .config import AgentConfig, Credentials, TradingConfig
 from .database import AgentDatabase
 from .hooks import create_audit_hooks
 from .kalshi_client import KalshiAPIClient
+from .kb_versioning import flush_kb_commit
 from .main import build_options
 from .tools import create_db_tools, create_market_tools
 
@@ -47,6 +49,13 @@ _WRAP_UP_PROMPT = (
 )
 
 
+def _pretty_json(data: Any) -> str:
+    """Indented JSON for prompt context (orjson; non-JSON types fall back to str)."""
+    return orjson.dumps(
+        data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
 class AgentServer:
     """WebSocket server managing the Claude SDK agent lifecycle."""
 
@@ -64,6 +73,9 @@ class AgentServer:
         self._kalshi: KalshiAPIClient | None = None
         self._client: ClaudeSDKClient | None = None
         self._session_id: str | None = None
+        # Market tools only close over the Kalshi client, so their MCP server
+        # is built once and shared by every session's SDK client.
+        self._markets_server: McpSdkServerConfig | None = None
 
         workspace = Path(agent_config.workspace)
         self._kb_path = workspace / "analysis" / "knowledge_base.md"
@@ -83,18 +95,26 @@ class AgentServer:
 
     async def start(self) -> None:
         """Initialize resources and start the WebSocket server."""
-        # Database
+        # Database -- the backup is a checkpoint plus a file copy, so run it on
+        # a worker thread (submitted immediately) while the exchange client is
+        # built; nothing else touches the DB until it finishes.
         self._db = AgentDatabase(self._trading_config.db_path)
-        backup = self._db.backup_if_needed(
-            self._trading_config.backup_dir,
-            max_age_hours=self._trading_config.backup_max_age_hours,
+        backup_future = asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                self._db.backup_if_needed,
+                self._trading_config.backup_dir,
+                max_age_hours=self._trading_config.backup_max_age_hours,
+            ),
         )
-        if backup:
-            logger.info("DB backup: %s", backup)
 
         # Exchange client
         self._kalshi = KalshiAPIClient(self._credentials, self._trading_config)
 
+        backup = await backup_future
+        if backup:
+            logger.info("DB backup: %s", backup)
+
         # Deferred extraction for sessions that missed logging (crash recovery)
         await self._deferred_extraction()
 
@@ -142,6 +162,10 @@ class AgentServer:
                 await self._client.__aexit__(None, None, None)
             self._client = None
 
+        # Commit any KB edits still inside the debounce window
+        with contextlib.suppress(Exception):
+            await flush_kb_commit()
+
         # Close DB
         if self._db:
             with contextlib.suppress(Exception):
@@ -224,59 +248,58 @@ class AgentServer:
             return ""
 
         session_state = db.get_session_state(current_session_id=self._session_id)
-        kb = self._kb_path.read_text(encoding="utf-8") if self._kb_path.exists() else ""
+        try:
+            kb = self._kb_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            kb = ""
 
         portfolio: dict[str, Any] | None = None
         try:
-            portfolio = {
-                "kalshi": {
-                    "balance": await self._kalshi.get_balance(),
-                    "positions": await self._kalshi.get_positions(),
-                }
-            }
+            balance, positions = await asyncio.gather(
+                self._kalshi.get_balance(), self._kalshi.get_positions()
+            )
+            portfolio = {"kalshi": {"balance": balance, "positions": positions}}
         except Exception:
             logger.debug("Could not fetch portfolio for session context", exc_info=True)
 
         parts = ["## Session Context"]
         if session_state.get("last_session"):
             parts.append(
-                f"### Last Session\n```json\n"
-                f"{json.dumps(session_state['last_session'], indent=2, default=str)}\n```"
+                f"### Last Session\n```json\n{_pretty_json(session_state['last_session'])}\n```"
             )
         if session_state.get("unreconciled_trades"):
             parts.append(
                 f"### Unreconciled Trades\n```json\n"
-                f"{json.dumps(session_state['unreconciled_trades'], indent=2, default=str)}\n```"
+                f"{_pretty_json(session_state['unreconciled_trades'])}\n```"
             )
         if portfolio:
-            parts.append(
-                f"### Portfolio\n```json\n{json.dumps(portfolio, indent=2, default=str)}\n```"
-            )
+            parts.append(f"### Portfolio\n```json\n{_pretty_json(portfolio)}\n```")
         if kb:
             parts.append(f"### Knowledge Base\n\n{kb}")
 
         return "\n\n".join(parts)
 
     def _build_client(self, session_id: str, session_context: str = "") -> ClaudeSDKClient:
-        """Build a new SDK client with fresh MCP servers and hooks."""
+        """Build a new SDK client with session-scoped MCP servers and hooks."""
         db = self._db
         kalshi = self._kalshi
         if not db or not kalshi:
             raise RuntimeError("Cannot build client before start()")
 
-        mcp_tools = {
-            "markets": create_market_tools(kalshi),
-            "db": create_db_tools(
-                db,
-                session_id,
-                kalshi,
-                self._trading_config,
-                self._trading_config.recommendation_ttl_minutes,
-            ),
-        }
+        if self._markets_server is None:
+            self._markets_server = create_sdk_mcp_server(
+                name="markets", version="1.0.0", tools=create_market_tools(kalshi)
+            )
+        db_tools = create_db_tools(
+            db,
+            session_id,
+            kalshi,
+            self._trading_config,
+            self._trading_config.recommendation_ttl_minutes,
+        )
         mcp_servers = {
-            key: create_sdk_mcp_server(name=key, version="1.0.0", tools=tools)
-            for key, tools in mcp_tools.items()
+            "markets": self._markets_server,
+            "db": create_sdk_mcp_server(name="db", version="1.0.0", tools=db_tools),
         }
         hooks = create_audit_hooks(
             on_recommendation=self._on_recommendation,
@@ -321,7 +344,7 @@ class AgentServer:
 
         try:
             async for raw in websocket:
-                msg = json.loads(raw)
+                msg = orjson.loads(raw)
                 msg_type = msg.get("type")
                 logger.debug("WS recv: %s", msg_type)
 
@@ -351,7 +374,9 @@ class AgentServer:
         """Send a JSON message to the connected TUI client."""
         if self._ws_client:
             try:
-                await self._ws_client.send(json.dumps(data, default=str))
+                await self._ws_client.send(
+                    orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+                )
             except websockets.ConnectionClosed:
                 self._ws_client = None
 
@@ -496,6 +521,7 @@ class AgentServer:
     ) -> PermissionResultAllow:
         """Permission handler — bridges AskUserQuestion to TUI via WebSocket."""
         if tool_name == "AskUserQuestion":
+            questions = input_data.get("questions", [])
             request_id = str(uuid.uuid4())[:8]
             future: asyncio.Future[dict[str, str]] = asyncio.get_running_loop().create_future()
             self._ask_futures[request_id] = future
@@ -504,7 +530,7 @@ class AgentServer:
                 {
                     "type": "ask_question",
                     "request_id": request_id,
-                    "questions": input_data.get("questions", []),
+                    "questions": questions,
                 }
             )
 
@@ -516,7 +542,7 @@ class AgentServer:
 
             return PermissionResultAllow(
                 updated_input={
-                    "questions": input_data.get("questions", []),
+                    "questions": questions,
                     "answers": answers,
                 }
             )
@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-import asyncio
-
 from .config import load_configs
+from .event_loop import run
 from .logging_config import setup_logging
 from .server import AgentServer
 
@@ -13,7 +12,7 @@ def main() -> None:
     agent_config, credentials, trading_config = load_configs()
     setup_logging(console=True)
     server = AgentServer(agent_config, trading_config, credentials)
-    asyncio.run(server.start())
+    run(server.start())
 
 
 if __name__ == "__main__":
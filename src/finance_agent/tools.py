@@ -7,6 +7,7 @@ import json
 import logging
 from typing import Any
 
+import orjson
 from claude_agent_sdk import tool
 
 from .config import TradingConfig
@@ -29,7 +30,8 @@ logger = logging.getLogger(__name__)
 
 def _text(data: Any) -> dict:
     """Wrap data as MCP text content."""
-    return {"content": [{"type": "text", "text": json.dumps(data, default=str)}]}
+    text = orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return {"content": [{"type": "text", "text": text}]}
 
 
 def create_market_tools(kalshi: KalshiAPIClient) -> list:
@@ -95,15 +97,14 @@ def create_market_tools(kalshi: KalshiAPIClient) -> list:
         },
     )
     async def get_portfolio(args: dict) -> dict:
-        data: dict[str, Any] = {
-            "balance": await kalshi.get_balance(),
-            "positions": await kalshi.get_positions(),
-        }
+        # Independent reads -- issue them concurrently (the rate limiter still paces them)
+        reads = {"balance": kalshi.get_balance(), "positions": kalshi.get_positions()}
         if args.get("include_fills"):
-            data["fills"] = await kalshi.get_fills()
+            reads["fills"] = kalshi.get_fills()
         if args.get("include_settlements"):
-            data["settlements"] = await kalshi.get_settlements()
-        return _text(data)
+            reads["settlements"] = kalshi.get_settlements()
+        results = await asyncio.gather(*reads.values())
+        return _text(dict(zip(reads, results, strict=True)))
 
     @tool(
         "get_orders",
@@ -187,15 +188,16 @@ def _validate_position_limits(
 
     Returns error string or None on success.
     """
+    max_position_usd = cfg.kalshi_max_position_usd
     for leg in enriched_legs:
         qty = leg.get("quantity", contracts)
         cost = leg["price_cents"] * qty / 100.0
-        fee = kalshi_fee(qty, leg["price_cents"], maker=leg.get("is_maker", False))
+        fee = kalshi_fee(qty, leg["price_cents"], maker=bool(leg.get("is_maker")))
         cost_with_fee = cost + fee
-        if cost_with_fee > cfg.kalshi_max_position_usd:
+        if cost_with_fee > max_position_usd:
             return (
                 f"Kalshi leg ${cost_with_fee:.2f} (incl ${fee:.4f} fee) "
-                f"exceeds limit ${cfg.kalshi_max_position_usd:.2f}"
+                f"exceeds limit ${max_position_usd:.2f}"
             )
     return None
 
@@ -204,11 +206,15 @@ def _validate_aggregate_limits(
     enriched_legs: list[dict[str, Any]],
     cfg: TradingConfig,
 ) -> str | None:
-    """Check total exposure doesn't exceed platform limits."""
-    total = sum(leg["price_cents"] * leg.get("quantity", 0) / 100.0 for leg in enriched_legs)
-    if total > cfg.kalshi_max_position_usd:
+    """Check total exposure doesn't exceed platform limits.
+
+    Pure integer-cent arithmetic; the message is only formatted on failure.
+    """
+    total_cents = sum(leg["price_cents"] * leg.get("quantity", 0) for leg in enriched_legs)
+    # Round the limit to whole cents: float limit*100 can land just below it (2.30 -> 229.99...)
+    if total_cents > round(cfg.kalshi_max_position_usd * 100):
         return (
-            f"Aggregate Kalshi exposure ${total:.2f} "
+            f"Aggregate Kalshi exposure ${total_cents / 100:.2f} "
             f"exceeds limit ${cfg.kalshi_max_position_usd:.2f}"
         )
     return None
@@ -226,6 +232,8 @@ def _build_db_legs(enriched_legs: list[dict[str, Any]], contracts: int) -> list[
             "quantity": leg.get("quantity", contracts),
             "price_cents": leg["price_cents"],
             "is_maker": leg.get("is_maker", False),
+            "yes_depth": leg.get("yes_depth"),
+            "no_depth": leg.get("no_depth"),
             "orderbook_snapshot_json": json.dumps(
                 {
                     "yes_ask": leg.get("yes_ask"),
@@ -397,13 +405,14 @@ def create_db_tools(
         if limit_error:
             return _text({"error": limit_error})
 
-        # Compute totals for response
-        total_cost = 0.0
+        # Compute totals for response (cost in integer cents until the end)
+        total_cost_cents = 0
         total_fees = 0.0
         for leg in enriched_legs:
             qty = leg["quantity"]
-            total_cost += leg["price_cents"] * qty / 100.0
-            total_fees += kalshi_fee(qty, leg["price_cents"], maker=leg.get("is_maker", False))
+            total_cost_cents += leg["price_cents"] * qty
+            total_fees += kalshi_fee(qty, leg["price_cents"], maker=bool(leg.get("is_maker")))
+        total_cost = total_cost_cents / 100
 
         # Store and respond
         group_id, expires_at = db.log_recommendation_group(
@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
 import logging
 from typing import Any, ClassVar
 
+import orjson
 import websockets
 import websockets.asyncio.client
 from textual.app import App
@@ -147,7 +147,7 @@ class FinanceApp(App):
 
         try:
             async for raw in ws:
-                msg = json.loads(raw)
+                msg = orjson.loads(raw)
                 msg_type = msg.get("type")
                 logger.debug("WS recv: %s", msg_type)
 
@@ -217,7 +217,9 @@ class FinanceApp(App):
         """Send a JSON message to the agent server."""
         if self._ws:
             try:
-                await self._ws.send(json.dumps(data, default=str))
+                await self._ws.send(
+                    orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+                )
             except websockets.ConnectionClosed:
                 logger.warning("Cannot send — WS connection closed")
                 self._ws = None
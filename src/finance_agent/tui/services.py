@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 from collections.abc import Callable
 from typing import Any
 
+import orjson
+
 from ..config import Credentials, TradingConfig
 from ..constants import (
     ACTION_BUY,
@@ -58,12 +60,10 @@ class TUIServices:
 
     async def get_portfolio(self) -> dict[str, Any]:
         """Fetch balances and positions from Kalshi."""
-        return {
-            "kalshi": {
-                "balance": await self._kalshi.get_balance(),
-                "positions": await self._kalshi.get_positions(),
-            }
-        }
+        balance, positions = await asyncio.gather(
+            self._kalshi.get_balance(), self._kalshi.get_positions()
+        )
+        return {"kalshi": {"balance": balance, "positions": positions}}
 
     async def get_orders(self, exchange: str | None = None) -> dict[str, Any]:
         """Fetch resting orders from Kalshi (exchange param kept for API compat)."""
@@ -89,6 +89,7 @@ class TUIServices:
 
     def validate_execution(self, group: dict[str, Any]) -> str | None:
         """Check position limits with fee-aware cost. Returns error or None."""
+        max_position_usd = self._config.kalshi_max_position_usd
         total_cost = 0.0
         for leg in group.get("legs", []):
             price_cents = leg.get("price_cents", 0)
@@ -97,14 +98,14 @@ class TUIServices:
                 return f"Leg {leg.get('market_id')} has no computed price/quantity"
 
             cost_usd = price_cents * quantity / 100
-            fee = kalshi_fee(quantity, price_cents, maker=leg.get("is_maker", False))
+            fee = kalshi_fee(quantity, price_cents, maker=bool(leg.get("is_maker")))
             total_with_fee = cost_usd + fee
             total_cost += total_with_fee
 
-            if total_with_fee > self._config.kalshi_max_position_usd:
+            if total_with_fee > max_position_usd:
                 return (
                     f"Order ${total_with_fee:.2f} (incl ${fee:.4f} fee) "
-                    f"exceeds kalshi limit ${self._config.kalshi_max_position_usd:.2f}"
+                    f"exceeds kalshi limit ${max_position_usd:.2f}"
                 )
 
         if total_cost > self._config.max_portfolio_usd:
@@ -155,10 +156,8 @@ class TUIServices:
             price = int(float(price) * 100)
         return int(price), int(qty)
 
-    async def _execute_and_log_leg(self, leg: dict[str, Any]) -> dict[str, Any]:
-        """Place order, log trade, update leg status. Returns result dict with order_id."""
-        result = await self.execute_order(leg)
-        order_id = self._extract_order_id(result)
+    def _record_placed_leg(self, leg: dict[str, Any], order_id: str, result: Any) -> None:
+        """Log the placed order and mark the leg executed (blocking DB writes)."""
         self.db.log_trade(
             session_id=self._session_id,
             ticker=leg["market_id"],
@@ -169,11 +168,21 @@ class TUIServices:
             order_type="limit",
             order_id=order_id,
             status=STATUS_PLACED,
-            result_json=json.dumps(result, default=str),
+            result_json=orjson.dumps(result, default=str).decode(),
             exchange=leg.get("exchange", EXCHANGE_KALSHI),
             leg_id=leg["id"],
         )
         self.db.update_leg_status(leg["id"], STATUS_EXECUTED, order_id)
+
+    async def _execute_and_log_leg(self, leg: dict[str, Any]) -> dict[str, Any]:
+        """Place order, log trade, update leg status. Returns result dict with order_id.
+
+        The DB writes run in a worker thread so the Textual event loop stays
+        responsive while the commit completes.
+        """
+        result = await self.execute_order(leg)
+        order_id = self._extract_order_id(result)
+        await asyncio.to_thread(self._record_placed_leg, leg, order_id, result)
         return {"leg_id": leg["id"], "status": STATUS_EXECUTED, "order_id": order_id}
 
     async def _refresh_legs_and_validate(
@@ -36,18 +36,18 @@ class KalshiFillMonitor:
         self._config = config
         self._ws: Any = None
         self._connected = False
+        self._private_key: Any = None
 
     def _ws_url(self) -> str:
         return f"{self._config.kalshi_base_url}/trade-api/ws/v2".replace("https://", "wss://")
 
-    def _auth_headers(self) -> dict[str, str]:
-        """Build RSA-PSS signed auth headers for WebSocket."""
-        from cryptography.hazmat.primitives import hashes, serialization
-        from cryptography.hazmat.primitives.asymmetric import padding
-        from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+    def _load_private_key(self) -> Any:
+        """Parse the RSA signing key once; reconnects reuse the parsed key."""
+        if self._private_key is not None:
+            return self._private_key
 
-        ts = str(int(time.time() * 1000))
-        message = ts + "GET" + "/trade-api/ws/v2"
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
 
         pem = self._credentials.kalshi_private_key
         if not pem:
@@ -59,6 +59,18 @@ class KalshiFillMonitor:
         private_key = serialization.load_pem_private_key(pem.encode(), password=None)
         if not isinstance(private_key, RSAPrivateKey):
             raise TypeError("Kalshi requires an RSA private key")
+        self._private_key = private_key
+        return private_key
+
+    def _auth_headers(self) -> dict[str, str]:
+        """Build RSA-PSS signed auth headers for WebSocket."""
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+
+        ts = str(int(time.time() * 1000))
+        message = ts + "GET" + "/trade-api/ws/v2"
+
+        private_key = self._load_private_key()
         signature = private_key.sign(
             message.encode(),
             padding.PSS(
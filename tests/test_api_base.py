@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import gc
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from finance_agent.api_base import BaseAPIClient
+from finance_agent.api_base import BaseAPIClient, iter_pages
 
 # ── _to_dict ─────────────────────────────────────────────────────
 
@@ -43,3 +46,70 @@ async def test_rate_write_calls_limiter():
     with patch.object(client._limiter, "acquire_write", new_callable=AsyncMock) as mock:
         await client._rate_write()
         mock.assert_awaited_once()
+
+
+# ── iter_pages ───────────────────────────────────────────────────
+
+
+async def test_iter_pages_follows_cursor():
+    fetch = AsyncMock(side_effect=[{"n": 1, "cursor": "c2"}, {"n": 2, "cursor": None}])
+    pages = [p["n"] async for p in iter_pages(fetch, status="open")]
+    assert pages == [1, 2]
+    assert fetch.call_args_list[0].kwargs == {"cursor": None, "status": "open"}
+    assert fetch.call_args_list[1].kwargs == {"cursor": "c2", "status": "open"}
+
+
+async def test_iter_pages_prefetches_next_page():
+    fetch = AsyncMock(side_effect=[{"n": 1, "cursor": "c2"}, {"n": 2, "cursor": None}])
+    page_iter = iter_pages(fetch)
+    await anext(page_iter)
+    # Page 2 was requested before the caller asked for it
+    assert fetch.await_count == 2
+    await page_iter.aclose()
+
+
+async def test_iter_pages_respects_max_pages():
+    fetch = AsyncMock(return_value={"cursor": "more"})
+    pages = [p async for p in iter_pages(fetch, max_pages=3)]
+    assert len(pages) == 3
+    assert fetch.call_count == 3
+
+
+async def test_iter_pages_close_cancels_prefetch():
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def fetch(cursor=None):
+        if cursor is None:
+            return {"cursor": "c2"}
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return {"cursor": None}
+
+    async with contextlib.aclosing(iter_pages(fetch)) as page_iter:
+        await anext(page_iter)
+        await started.wait()
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+async def test_iter_pages_close_retrieves_failed_prefetch():
+    reported: list[dict] = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda _loop, ctx: reported.append(ctx))
+
+    async def fetch(cursor=None):
+        if cursor is None:
+            return {"cursor": "c2"}
+        raise RuntimeError("page 2 failed")
+
+    async with contextlib.aclosing(iter_pages(fetch)) as page_iter:
+        await anext(page_iter)
+        await asyncio.sleep(0)  # let the prefetch fail before closing
+    gc.collect()
+    await asyncio.sleep(0)
+    loop.set_exception_handler(None)
+    assert reported == []
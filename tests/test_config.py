@@ -83,6 +83,14 @@ def test_build_system_prompt_no_unresolved_placeholders():
     assert not re.search(r"\{\{[A-Z_]+\}\}", prompt)
 
 
+def test_build_system_prompt_cached_per_config_values():
+    first = build_system_prompt(TradingConfig())
+    assert build_system_prompt(TradingConfig()) is first
+    changed = build_system_prompt(TradingConfig(kalshi_max_position_usd=250.0))
+    assert "250.0" in changed
+    assert changed is not first
+
+
 # ── load_prompt ──────────────────────────────────────────────────
 
 
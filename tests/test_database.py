@@ -183,6 +183,27 @@ def test_log_recommendation_group_with_multiple_legs(db, session_id):
     assert all(leg["exchange"] == "kalshi" for leg in group["legs"])
 
 
+def test_log_recommendation_group_stores_depth(db, session_id):
+    group_id, _ = db.log_recommendation_group(
+        session_id=session_id,
+        legs=[
+            {
+                "exchange": "kalshi",
+                "market_id": "K-1",
+                "action": "buy",
+                "side": "yes",
+                "quantity": 10,
+                "price_cents": 30,
+                "yes_depth": 25,
+                "no_depth": 7,
+            },
+        ],
+    )
+    leg = db.get_group(group_id)["legs"][0]
+    assert leg["yes_depth"] == 25
+    assert leg["no_depth"] == 7
+
+
 def test_log_recommendation_group_ttl(db, session_id):
     _, expires_at = db.log_recommendation_group(
         session_id=session_id,
@@ -425,6 +446,23 @@ def test_settle_legs_idempotent(db, session_id):
     assert db.settle_legs("K-1", 100) == 0  # Already settled
 
 
+def test_settle_legs_bulk(db, session_id):
+    group_id, _ = db.log_recommendation_group(
+        session_id=session_id,
+        legs=[
+            {"exchange": "kalshi", "market_id": "K-1", "action": "buy", "side": "yes"},
+            {"exchange": "kalshi", "market_id": "K-2", "action": "buy", "side": "no"},
+            {"exchange": "kalshi", "market_id": "K-2", "action": "sell", "side": "yes"},
+        ],
+    )
+    counts = db.settle_legs_bulk({"K-1": 100, "K-2": 0, "K-OTHER": 100})
+    assert counts == {"K-1": 1, "K-2": 2}
+    legs = db.get_group(group_id)["legs"]
+    assert [leg["settlement_value"] for leg in legs] == [100, 0, 0]
+    assert db.settle_legs_bulk({"K-1": 100}) == {}
+    assert db.settle_legs_bulk({}) == {}
+
+
 def test_get_groups_pending_pnl_not_ready(db, session_id):
     """Group with unsettled legs should not appear."""
     db.log_recommendation_group(
@@ -0,0 +1,32 @@
+"""Tests for finance_agent.event_loop."""
+
+from __future__ import annotations
+
+import asyncio
+import builtins
+from unittest.mock import patch
+
+import pytest
+
+from finance_agent.event_loop import run
+
+
+async def _loop_module() -> str:
+    return type(asyncio.get_running_loop()).__module__
+
+
+def test_run_uses_uvloop_when_installed():
+    pytest.importorskip("uvloop")
+    assert run(_loop_module()).startswith("uvloop")
+
+
+def test_run_falls_back_without_uvloop():
+    real_import = builtins.__import__
+
+    def fake_import(name, *args, **kwargs):
+        if name == "uvloop":
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    with patch("builtins.__import__", side_effect=fake_import):
+        assert run(_loop_module()).startswith("asyncio")
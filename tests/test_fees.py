@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 
-from finance_agent.fees import assess_depth_concern, compute_hypothetical_pnl
+from finance_agent.fees import assess_depth_concern, compute_hypothetical_pnl, kalshi_fee
 
 # ── P&L ─────────────────────────────────────────────────────────
 
@@ -181,6 +181,25 @@ def test_pnl_manual_buy_no_lose():
     assert pnl < -4.0
 
 
+def test_pnl_manual_sell_no_lose():
+    """SELL NO at 40c, YES settles at 0 (NO won) → loss."""
+    group = {
+        "strategy": "manual",
+        "legs": [
+            {
+                "price_cents": 40,
+                "quantity": 10,
+                "action": "sell",
+                "side": "no",
+                "is_maker": False,
+                "settlement_value": 0,
+            },
+        ],
+    }
+    # Gross = (40 - 100) * 10 / 100 = -$6.00, taker fee $0.17
+    assert compute_hypothetical_pnl(group) == -6.17
+
+
 def test_pnl_manual_unsettled_leg_skipped():
     """Legs with settlement_value=None are skipped in P&L calculation."""
     group = {
@@ -199,6 +218,23 @@ def test_pnl_manual_unsettled_leg_skipped():
     assert compute_hypothetical_pnl(group) == 0.0
 
 
+# ── Fees ────────────────────────────────────────────────────────
+
+
+def test_kalshi_fee_values():
+    assert kalshi_fee(10, 50) == 0.18
+    assert kalshi_fee(10, 50, maker=True) == 0.05
+    assert kalshi_fee(0, 50) == 0.0
+    assert kalshi_fee(10, 100) == 0.0
+
+
+def test_kalshi_fee_is_memoized():
+    kalshi_fee(37, 41)
+    hits = kalshi_fee.cache_info().hits
+    kalshi_fee(37, 41)
+    assert kalshi_fee.cache_info().hits == hits + 1
+
+
 # ── Depth concern ───────────────────────────────────────────────
 
 
@@ -237,3 +273,21 @@ def test_assess_depth_no_side():
     result = assess_depth_concern(leg)
     assert result is not None
     assert "no" in result
+
+
+def test_assess_depth_prefers_typed_columns():
+    leg = {
+        "quantity": 10,
+        "side": "yes",
+        "yes_depth": 4,
+        "no_depth": 50,
+        "orderbook_snapshot_json": "not json",
+    }
+    result = assess_depth_concern(leg)
+    assert result is not None
+    assert "Depth 4" in result
+
+
+def test_assess_depth_typed_columns_without_snapshot():
+    leg = {"quantity": 10, "side": "no", "yes_depth": None, "no_depth": 30}
+    assert assess_depth_concern(leg) is None
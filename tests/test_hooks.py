@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from finance_agent.hooks import create_audit_hooks
+from unittest.mock import patch
+
+import pytest
+
+from finance_agent.hooks import _is_tool_error, create_audit_hooks
 
 
 def _hook(hooks, event, idx=0):
@@ -21,6 +25,13 @@ async def test_auto_approve_allows_regular_tool():
     assert "updatedInput" not in result["hookSpecificOutput"]
 
 
+async def test_auto_approve_reuses_allow_response():
+    pre = _hook(create_audit_hooks(), "PreToolUse")
+    first = await pre({"tool_name": "Read", "tool_input": {}}, "tid-1", None)
+    second = await pre({"tool_name": "Grep", "tool_input": {}}, "tid-2", None)
+    assert first is second
+
+
 async def test_auto_approve_skips_ask_user():
     pre = _hook(create_audit_hooks(), "PreToolUse")
     result = await pre({"tool_name": "AskUserQuestion", "tool_input": {}}, "tid-1", None)
@@ -70,6 +81,27 @@ async def test_audit_recommendation_calls_callback():
     assert len(calls) == 3
 
 
+# ── commit_kb_if_written ──────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    ("tool_name", "tool_input", "expected"),
+    [
+        ("Write", {"file_path": "/workspace/analysis/knowledge_base.md"}, True),
+        ("Edit", {"file_path": "/workspace/analysis/notes.md"}, False),
+        ("Bash", {"command": "echo hi >> /workspace/analysis/knowledge_base.md"}, True),
+        ("Bash", {"command": "sed -i s/a/b/ knowledge_base.md"}, True),
+        ("Bash", {"command": "cat /workspace/analysis/knowledge_base.md"}, False),
+        ("Bash", {"command": "echo hi >> notes.md"}, False),
+    ],
+)
+async def test_commit_kb_if_written(tool_name, tool_input, expected):
+    post = _hook(create_audit_hooks(), "PostToolUse", idx=1)
+    with patch("finance_agent.hooks.schedule_kb_commit") as mock_schedule:
+        await post({"tool_name": tool_name, "tool_input": tool_input}, "tid-1", None)
+    assert mock_schedule.call_count == (1 if expected else 0)
+
+
 # ── Hook structure ───────────────────────────────────────────────
 
 
@@ -95,3 +127,41 @@ async def test_on_recommendation_callback():
     await post({}, None, None)
     await post({}, None, None)
     assert len(calls) == 2
+
+
+async def test_audit_recommendation_skips_tool_error():
+    calls = []
+    hooks = create_audit_hooks(on_recommendation=lambda: calls.append(1))
+    post = _hook(hooks, "PostToolUse")
+    error = {"content": [{"type": "text", "text": '{"error": "Position limit exceeded"}'}]}
+    ok = {"content": [{"type": "text", "text": '{"group_id": 1, "legs": []}'}]}
+    await post({"tool_response": error}, None, None)
+    await post({"tool_response": ok}, None, None)
+    assert len(calls) == 1
+
+
+async def test_audit_recommendation_counts_nested_error_text():
+    """An "error" string inside a successful payload is not a tool error."""
+    calls = []
+    hooks = create_audit_hooks(on_recommendation=lambda: calls.append(1))
+    post = _hook(hooks, "PostToolUse")
+    text = '{"group_id": 1, "legs": [{"note": {"error": "stale quote"}}]}'
+    await post({"tool_response": {"content": [{"type": "text", "text": text}]}}, None, None)
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    ("response", "expected"),
+    [
+        (None, False),
+        ({}, False),
+        ({"content": [{"type": "text", "text": '{"error": "boom"}'}]}, True),
+        ([{"type": "text", "text": '{"error": "boom"}'}], True),
+        ([{"type": "text", "text": '{"error": '}], False),
+        ('{"error": "boom"}', True),
+        ('{"ok": true}', False),
+        (42, False),
+    ],
+)
+def test_is_tool_error(response, expected):
+    assert _is_tool_error(response) is expected
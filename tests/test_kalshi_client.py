@@ -7,7 +7,7 @@ from unittest.mock import AsyncMock, MagicMock, mock_open, patch
 import pytest
 
 from finance_agent.config import Credentials, TradingConfig
-from finance_agent.kalshi_client import KalshiAPIClient, _optional
+from finance_agent.kalshi_client import KalshiAPIClient, _optional, _read_pem
 
 # ── _optional helper ─────────────────────────────────────────────
 
@@ -24,6 +24,20 @@ def test_optional_empty():
     assert _optional() == {}
 
 
+# ── _read_pem cache ──────────────────────────────────────────────
+
+
+def test_read_pem_cached_until_mtime_changes(tmp_path):
+    key_file = tmp_path / "key.pem"
+    key_file.write_text("KEY-1")
+    path = str(key_file)
+    assert _read_pem(path, 1) == "KEY-1"
+
+    key_file.write_text("KEY-2")
+    assert _read_pem(path, 1) == "KEY-1"  # same mtime -> cached
+    assert _read_pem(path, 2) == "KEY-2"
+
+
 # ── Client fixture ───────────────────────────────────────────────
 
 
@@ -41,6 +55,7 @@ def kalshi_client(monkeypatch):
     with (
         patch("finance_agent.kalshi_client.KalshiClient") as mock_sdk,
         patch("pathlib.Path.open", mock_open(read_data="FAKE_PEM_KEY")),
+        patch("pathlib.Path.stat"),
     ):
         client = KalshiAPIClient(credentials, config)
         # Replace SDK methods with AsyncMocks
@@ -92,12 +107,81 @@ async def test_get_orderbook_passes_depth(kalshi_client):
     kalshi_client._client.get_market_orderbook.assert_awaited_once_with("TICKER-1", depth=5)
 
 
+async def test_get_orderbook_falls_back_to_raw_json(kalshi_client):
+    kalshi_client._client.get_market_orderbook.side_effect = ValueError("null yes_dollars")
+    raw = MagicMock()
+    raw.read = AsyncMock(return_value=b'{"orderbook": {"yes": null, "no": [[55, 10]]}}')
+    api = kalshi_client._client._market_api
+    api.get_market_orderbook_without_preload_content = AsyncMock(return_value=raw)
+    result = await kalshi_client.get_orderbook("TICKER-1", depth=5)
+    assert result == {"orderbook": {"yes": None, "no": [[55, 10]]}}
+
+
 async def test_get_events_forwards_cursor(kalshi_client):
     await kalshi_client.get_events(status="open", cursor="abc123")
     call_kwargs = kalshi_client._client.get_events.call_args[1]
     assert call_kwargs["cursor"] == "abc123"
 
 
+async def test_get_candlesticks_explicit_window_skips_clock(kalshi_client):
+    with patch("finance_agent.kalshi_client.time") as mock_time:
+        await kalshi_client.get_candlesticks("T-1", start_ts=100, end_ts=200)
+    mock_time.time.assert_not_called()
+    kwargs = kalshi_client._client.batch_get_market_candlesticks.call_args.kwargs
+    assert (kwargs["start_ts"], kwargs["end_ts"]) == (100, 200)
+
+
+async def test_get_candlesticks_defaults_to_last_day(kalshi_client):
+    with patch("finance_agent.kalshi_client.time") as mock_time:
+        mock_time.time.return_value = 1_000_000.5
+        await kalshi_client.get_candlesticks("T-1")
+    kwargs = kalshi_client._client.batch_get_market_candlesticks.call_args.kwargs
+    assert (kwargs["start_ts"], kwargs["end_ts"]) == (1_000_000 - 86400, 1_000_000)
+
+
+# ── Response cache ───────────────────────────────────────────────
+
+
+async def test_get_market_cached_within_ttl(kalshi_client):
+    kalshi_client._clock = lambda: 100.0
+    await kalshi_client.get_market("TICKER-1")
+    await kalshi_client.get_market("TICKER-1")
+    assert kalshi_client._client.get_market.await_count == 1
+
+    kalshi_client._clock = lambda: 103.0
+    await kalshi_client.get_market("TICKER-1")
+    assert kalshi_client._client.get_market.await_count == 2
+
+
+async def test_get_market_cache_hit_skips_rate_limiter(kalshi_client):
+    await kalshi_client.get_market("TICKER-1")
+    with patch.object(kalshi_client, "_rate_read", new_callable=AsyncMock) as mock_rate:
+        await kalshi_client.get_market("TICKER-1")
+        mock_rate.assert_not_awaited()
+
+
+async def test_cached_response_isolated_from_caller_mutation(kalshi_client):
+    resp = MagicMock()
+    resp.to_dict.return_value = {"market": {"ticker": "TICKER-1", "yes_bid": 45}}
+    kalshi_client._client.get_market = AsyncMock(return_value=resp)
+
+    first = await kalshi_client.get_market("TICKER-1")
+    first["market"]["yes_bid"] = 0
+    second = await kalshi_client.get_market("TICKER-1")
+    second["extra"] = True
+    second["market"]["yes_bid"] = 1
+    third = await kalshi_client.get_market("TICKER-1")
+
+    assert kalshi_client._client.get_market.await_count == 1
+    assert third == {"market": {"ticker": "TICKER-1", "yes_bid": 45}}
+
+
+async def test_get_orderbook_not_cached(kalshi_client):
+    await kalshi_client.get_orderbook("TICKER-1")
+    await kalshi_client.get_orderbook("TICKER-1")
+    assert kalshi_client._client.get_market_orderbook.await_count == 2
+
+
 # ── Response conversion ──────────────────────────────────────────
 
 
@@ -114,3 +198,13 @@ async def test_get_balance_returns_dict(kalshi_client):
     kalshi_client._client.get_balance = AsyncMock(return_value=mock_resp)
     result = await kalshi_client.get_balance()
     assert result == {"balance": 1000}
+
+
+def test_build_client_sets_connection_pool_size(monkeypatch):
+    for key in Credentials.model_fields:
+        monkeypatch.setenv(key.upper(), "")
+    credentials = Credentials(kalshi_api_key_id="test-key", kalshi_private_key="PEM")
+    config = TradingConfig(kalshi_connection_pool_size=8)
+    with patch("finance_agent.kalshi_client.KalshiClient") as mock_sdk:
+        KalshiAPIClient(credentials, config)
+    assert mock_sdk.call_args.args[0].connection_pool_maxsize == 8
@@ -0,0 +1,144 @@
+"""Tests for finance_agent.kb_versioning -- git-backed KB history."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from finance_agent import kb_versioning
+from finance_agent.kb_versioning import flush_kb_commit, get_version_content, schedule_kb_commit
+
+
+@pytest.fixture(autouse=True)
+def _reset_module_state():
+    kb_versioning._version_cache.clear()
+    kb_versioning._pending_commit = None
+    kb_versioning._commit_tasks.clear()
+    kb_versioning._commit_lock = None
+    kb_versioning._git_available = None
+    yield
+    kb_versioning._version_cache.clear()
+    kb_versioning._pending_commit = None
+    kb_versioning._commit_tasks.clear()
+    kb_versioning._commit_lock = None
+    kb_versioning._git_available = None
+
+
+# ── _run_git ─────────────────────────────────────────────────────
+
+
+async def test_run_git_returns_code_and_stdout(tmp_path):
+    rc, _ = await kb_versioning._run_git("init", "-q", cwd=str(tmp_path))
+    assert rc == 0
+    rc, out = await kb_versioning._run_git("rev-parse", "--is-inside-work-tree", cwd=str(tmp_path))
+    assert (rc, out) == (0, "true")
+
+
+async def test_run_git_nonzero_exit(tmp_path):
+    rc, out = await kb_versioning._run_git("rev-parse", "--verify", "nope", cwd=str(tmp_path))
+    assert rc != 0
+    assert out == ""
+
+
+# ── Git detection ────────────────────────────────────────────────
+
+
+async def test_detect_git_uses_dot_git_without_spawning(tmp_path):
+    (tmp_path / ".git").mkdir()
+    with patch.object(kb_versioning, "_run_git", new_callable=AsyncMock) as mock_git:
+        assert await kb_versioning._detect_git(str(tmp_path)) is True
+    mock_git.assert_not_awaited()
+
+
+async def test_detect_git_falls_back_to_rev_parse(tmp_path):
+    with patch.object(
+        kb_versioning, "_run_git", new_callable=AsyncMock, return_value=(128, "")
+    ) as mock_git:
+        assert await kb_versioning._detect_git(str(tmp_path)) is False
+    mock_git.assert_awaited_once_with("rev-parse", "--git-dir", cwd=str(tmp_path))
+
+
+# ── get_version_content ──────────────────────────────────────────
+
+
+async def test_get_version_content_cached_per_sha():
+    with patch.object(
+        kb_versioning, "_run_git", new_callable=AsyncMock, return_value=(0, "# KB v1")
+    ) as mock_git:
+        assert await get_version_content("abc123", repo_dir="/repo") == "# KB v1"
+        assert await get_version_content("abc123", repo_dir="/repo") == "# KB v1"
+    mock_git.assert_awaited_once()
+
+
+async def test_get_version_content_failure_not_cached():
+    with patch.object(
+        kb_versioning, "_run_git", new_callable=AsyncMock, return_value=(128, "")
+    ) as mock_git:
+        assert await get_version_content("bad", repo_dir="/repo") is None
+        assert await get_version_content("bad", repo_dir="/repo") is None
+    assert mock_git.await_count == 2
+
+
+# ── Debounced commits ────────────────────────────────────────────
+
+
+async def test_schedule_kb_commit_coalesces_edits():
+    with patch.object(kb_versioning, "commit_kb", new_callable=AsyncMock) as mock_commit:
+        for _ in range(3):
+            schedule_kb_commit(repo_dir="/repo", delay=0.01)
+        task, _ = kb_versioning._pending_commit
+        await task
+    mock_commit.assert_awaited_once_with("/repo")
+    assert kb_versioning._pending_commit is None
+    assert not kb_versioning._commit_tasks
+
+
+async def test_flush_kb_commit_runs_pending_commit_now():
+    with patch.object(kb_versioning, "commit_kb", new_callable=AsyncMock) as mock_commit:
+        schedule_kb_commit(repo_dir="/repo", delay=60)
+        await flush_kb_commit()
+    mock_commit.assert_awaited_once_with("/repo")
+
+
+async def test_flush_kb_commit_without_pending_is_noop():
+    with patch.object(kb_versioning, "commit_kb", new_callable=AsyncMock) as mock_commit:
+        await flush_kb_commit()
+    mock_commit.assert_not_awaited()
+
+
+async def test_flush_kb_commit_waits_for_running_commit():
+    started = asyncio.Event()
+    release = asyncio.Event()
+    finished = False
+
+    async def slow_commit(_repo_dir: str) -> bool:
+        nonlocal finished
+        started.set()
+        await release.wait()
+        finished = True
+        return True
+
+    with patch.object(kb_versioning, "commit_kb", side_effect=slow_commit):
+        schedule_kb_commit(repo_dir="/repo", delay=0)
+        await started.wait()
+        # The commit has started, so nothing is pending, but flush must still wait
+        assert kb_versioning._pending_commit is None
+        flush_task = asyncio.create_task(flush_kb_commit())
+        await asyncio.sleep(0)
+        assert not flush_task.done()
+        release.set()
+        await flush_task
+    assert finished
+
+
+def test_commit_lock_is_per_event_loop():
+    async def get_lock() -> asyncio.Lock:
+        return kb_versioning._get_commit_lock()
+
+    async def same_loop_twice() -> bool:
+        return await get_lock() is await get_lock()
+
+    assert asyncio.run(same_loop_twice())
+    assert asyncio.run(get_lock()) is not asyncio.run(get_lock())
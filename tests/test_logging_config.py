@@ -0,0 +1,50 @@
+"""Tests for finance_agent.logging_config."""
+
+from __future__ import annotations
+
+import logging
+import time
+from logging.handlers import QueueHandler
+from unittest.mock import patch
+
+from finance_agent.logging_config import _CachedTimeFormatter, setup_logging
+
+
+def _record(created: float) -> logging.LogRecord:
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+    record.created = created
+    return record
+
+
+def test_cached_formatter_matches_strftime():
+    fmt = _CachedTimeFormatter("%(asctime)s %(message)s", "%Y-%m-%d %H:%M:%S")
+    created = 1_700_000_000.25
+    expected = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created))
+    assert fmt.format(_record(created)) == f"{expected} msg"
+
+
+def test_cached_formatter_reuses_same_second():
+    fmt = _CachedTimeFormatter("%(asctime)s", "%H:%M:%S")
+    first = fmt.formatTime(_record(1_700_000_000.1))
+    assert fmt.formatTime(_record(1_700_000_000.9)) is first
+    assert fmt.formatTime(_record(1_700_000_001.0)) != first
+
+
+def test_setup_logging_writes_file_through_queue(tmp_path):
+    root = logging.getLogger()
+    saved, saved_level = root.handlers[:], root.level
+    root.handlers.clear()
+    log_file = tmp_path / "app.log"
+    try:
+        with patch("finance_agent.logging_config.atexit.register") as register:
+            setup_logging(console=False, log_file=log_file)
+        assert any(isinstance(h, QueueHandler) for h in root.handlers)
+        logging.getLogger("test.queue").info("queued record")
+        listener_stop = register.call_args.args[0]
+        listener_stop()  # joins the listener thread after draining the queue
+    finally:
+        for handler in root.handlers:
+            handler.close()
+        root.handlers[:] = saved
+        root.setLevel(saved_level)
+    assert "queued record" in log_file.read_text(encoding="utf-8")
@@ -4,7 +4,28 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
-from finance_agent.main import build_options
+import pytest
+from claude_agent_sdk._errors import MessageParseError
+
+from finance_agent.main import _tolerant_parse, build_options
+
+# ── _tolerant_parse ──────────────────────────────────────────────
+
+
+def test_tolerant_parse_skips_unknown_message_type():
+    err = MessageParseError("Unknown message type: rate_limit_event", {})
+    with patch("finance_agent.main._original_parse", side_effect=err):
+        assert _tolerant_parse({"type": "rate_limit_event"}) is None
+
+
+def test_tolerant_parse_reraises_other_errors():
+    err = MessageParseError("Message missing 'type' field", {})
+    with (
+        patch("finance_agent.main._original_parse", side_effect=err),
+        pytest.raises(MessageParseError),
+    ):
+        _tolerant_parse({})
+
 
 # ── build_options ────────────────────────────────────────────────
 
@@ -13,6 +34,7 @@ def test_build_options_returns_options(db, session_id):
     agent_config = MagicMock()
     agent_config.model = "claude-sonnet-4-5-20250929"
     agent_config.max_budget_usd = 1.0
+    agent_config.max_buffer_size = 4 * 1024 * 1024
     trading_config = MagicMock()
 
     with patch("finance_agent.main.build_system_prompt", return_value="test prompt"):
@@ -25,3 +47,4 @@ def test_build_options_returns_options(db, session_id):
         )
     assert result.model == "claude-sonnet-4-5-20250929"
     assert result.permission_mode == "acceptEdits"
+    assert result.max_buffer_size == 4 * 1024 * 1024
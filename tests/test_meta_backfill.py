@@ -0,0 +1,97 @@
+"""Tests for finance_agent.meta_backfill -- market metadata backfill."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+from finance_agent import meta_backfill
+from finance_agent.meta_backfill import _get_missing_tickers, _phase_historical, _phase_live
+
+# ── _phase_historical ────────────────────────────────────────────
+
+
+def _market(ticker: str) -> dict:
+    return {
+        "ticker": ticker,
+        "event_ticker": f"EV-{ticker}",
+        "series_ticker": "SER",
+        "title": f"Market {ticker}",
+        "category": "Economics",
+    }
+
+
+def _daily(ticker: str, date: str) -> dict:
+    return {
+        "date": date,
+        "ticker_name": ticker,
+        "report_ticker": ticker,
+        "payout_type": "binary",
+        "open_interest": 1,
+        "daily_volume": 1,
+        "block_volume": 0,
+        "high": 50,
+        "low": 50,
+        "status": "open",
+    }
+
+
+async def test_phase_historical_follows_cursor_and_upserts(db, mock_kalshi):
+    mock_kalshi.get_historical_cutoff = AsyncMock(return_value={"market_settled_ts": 0})
+    mock_kalshi.get_historical_markets = AsyncMock(
+        side_effect=[
+            {"markets": [_market("H-1"), _market("H-2")], "cursor": "c1"},
+            {"markets": [_market("H-3")], "cursor": None},
+        ]
+    )
+    fetched, upserted = await _phase_historical(mock_kalshi, db)
+    assert (fetched, upserted) == (3, 3)
+    cursors = [c.kwargs["cursor"] for c in mock_kalshi.get_historical_markets.call_args_list]
+    assert cursors == [None, "c1"]
+
+
+async def test_phase_historical_stops_on_empty_page(db, mock_kalshi):
+    mock_kalshi.get_historical_cutoff = AsyncMock(return_value={})
+    mock_kalshi.get_historical_markets = AsyncMock(
+        side_effect=[
+            {"markets": [_market("H-1")], "cursor": "c1"},
+            {"markets": [], "cursor": "c2"},
+            {"markets": [_market("H-9")], "cursor": None},
+        ]
+    )
+    fetched, _ = await _phase_historical(mock_kalshi, db)
+    assert fetched == 1
+
+
+# ── _get_missing_tickers ─────────────────────────────────────────
+
+
+def test_get_missing_tickers_skips_known_and_orders_by_history(db):
+    db.insert_kalshi_daily(
+        [
+            _daily("A-1", "2026-01-01"),
+            _daily("B-1", "2026-01-01"),
+            _daily("B-1", "2026-01-02"),
+            _daily("KNOWN", "2026-01-01"),
+        ]
+    )
+    db.upsert_market_meta([_market("KNOWN")])
+    assert _get_missing_tickers(db) == ["B-1", "A-1"]
+    assert _get_missing_tickers(db, min_days=2) == ["B-1"]
+    assert _get_missing_tickers(db, prefix="A%") == ["A-1"]
+
+
+# ── _phase_live ──────────────────────────────────────────────────
+
+
+async def test_phase_live_counts_batch_errors(db, mock_kalshi, monkeypatch):
+    monkeypatch.setattr(meta_backfill, "_BATCH_SIZE", 1)
+    db.insert_kalshi_daily([_daily(t, "2026-01-01") for t in ("L-1", "L-2", "L-3")])
+
+    async def search_markets(*, tickers: str, limit: int) -> dict:
+        if tickers == "L-2":
+            raise RuntimeError("boom")
+        return {"markets": [_market(tickers)]}
+
+    mock_kalshi.search_markets = AsyncMock(side_effect=search_markets)
+    requested, upserted, errors = await _phase_live(mock_kalshi, db, min_days=0)
+    assert (requested, upserted, errors) == (3, 2, 1)
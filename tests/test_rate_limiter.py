@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from types import SimpleNamespace
 from unittest.mock import patch
 
 from finance_agent.rate_limiter import RateLimiter
@@ -90,6 +93,34 @@ def test_acquire_write_sync():
     rl.acquire_write_sync()
 
 
+def test_acquire_sync_concurrent_threads_do_not_sleep_under_lock():
+    rl = RateLimiter(reads_per_sec=50, writes_per_sec=50)
+    rl._tokens["read"] = 0.0
+    real_sleep = time.sleep
+    lock_free_while_sleeping = []
+
+    def checking_sleep(seconds: float) -> None:
+        # Lock is non-reentrant: acquiring it here times out if the sleeper holds it
+        acquired = rl._lock.acquire(timeout=0.5)
+        if acquired:
+            rl._lock.release()
+        lock_free_while_sleeping.append(acquired)
+        real_sleep(seconds)
+
+    # Swap only the module's ``time`` name so other threads keep the real sleep
+    fake_time = SimpleNamespace(monotonic=time.monotonic, sleep=checking_sleep)
+    threads = [threading.Thread(target=rl.acquire_read_sync) for _ in range(10)]
+    with patch("finance_agent.rate_limiter.time", fake_time):
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=30)
+
+    assert not any(t.is_alive() for t in threads)
+    assert lock_free_while_sleeping
+    assert all(lock_free_while_sleeping)
+
+
 # ── Cost parameter ──────────────────────────────────────────────
 
 
@@ -4,7 +4,15 @@ from __future__ import annotations
 
 import json
 
-from finance_agent.tools import _text, create_db_tools, create_market_tools
+import pytest
+
+from finance_agent.config import TradingConfig
+from finance_agent.tools import (
+    _text,
+    _validate_aggregate_limits,
+    create_db_tools,
+    create_market_tools,
+)
 
 
 def _call(tool_list, index):
@@ -189,6 +197,17 @@ async def test_recommend_trade_manual_aggregate_limit(db, session_id, mock_kalsh
     )
     data = json.loads(result["content"][0]["text"])
     assert "error" in data
+    assert data["error"].startswith("Aggregate Kalshi exposure $50.00")
+
+
+@pytest.mark.parametrize("limit_usd", [2.30, 1.15, 0.29, 4.35])
+def test_aggregate_limit_allows_exposure_exactly_at_limit(limit_usd):
+    cfg = TradingConfig(kalshi_max_position_usd=limit_usd)
+    limit_cents = round(limit_usd * 100)
+    at_limit = [{"price_cents": limit_cents, "quantity": 1}]
+    over_limit = [{"price_cents": limit_cents + 1, "quantity": 1}]
+    assert _validate_aggregate_limits(at_limit, cfg) is None
+    assert _validate_aggregate_limits(over_limit, cfg) is not None
 
 
 async def test_recommend_trade_stores_strategy_manual(db, session_id, mock_kalshi):